@@ -0,0 +1,249 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import pytest
+
+from test_currency_triangle_arbitrage import CurrencyTriangleArbitrage
+from test_market_graph import CSRCurrencyArbitrage
+from test_spfa_arbitrage import SPFACurrencyArbitrage
+from test_vectorized_arbitrage import VectorizedCurrencyArbitrage, np, random_market
+
+
+SIZES = (10, 50, 100, 500, 1_000, 5_000)
+
+# degree per currency; "dense" grows with the market, capped so the
+# 5,000-currency case stays around a million quotes
+CONNECTIVITY = {
+    "sparse": lambda n: min(n - 1, 4),
+    "dense": lambda n: min(n - 1, max(16, n // 20)),
+}
+
+# engine name: (factory, work estimate(V, E, planted) in relaxation checks,
+#               default max_work)
+# Cases over max_work are skipped, not run. Plain Bellman-Ford always does
+# V-1 full passes; SPFA settles a clean market in a few sweeps, but a
+# small planted cycle keeps it relaxing for up to a fraction of V·E
+# (measured: ~V·E/20 for sparse 5,000). NumPy passes run ~50x faster.
+# Plain Bellman-Ford checks ~5M edges/s, so its budget covers sparse
+# 5,000 (~25 s per run). Dense 5,000 (V·E ≈ 6e9, hours per run) is the
+# one case left out by default; pass --max-work 1e10 to include it.
+ENGINES = {
+    "bellman_ford": (CurrencyTriangleArbitrage,
+                     lambda v, e, planted: v * e, 1.5e8),
+    "spfa": (SPFACurrencyArbitrage,
+             lambda v, e, planted: v * e / 20 if planted else 10 * e, 2e7),
+    "csr_spfa": (CSRCurrencyArbitrage,
+                 lambda v, e, planted: v * e / 20 if planted else 10 * e, 2e7),
+    "numpy_bellman_ford": (VectorizedCurrencyArbitrage,
+                           lambda v, e, planted: v * e / 50, 2e7),
+}
+
+# CurrencyTriangleArbitrage takes its source currency from set order, so
+# its relaxation counts depend on string hashing: __main__ re-runs itself
+# with this seed and every report records the seed it ran under.
+HASH_SEED = "0"
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_case(engine_name, market, repeat=3):
+    """Best-of-repeat seconds, then peak traced bytes from one extra run"""
+    factory = ENGINES[engine_name][0]
+    best = float("inf")
+    for _ in range(repeat):
+        engine = factory()
+        start = time.perf_counter()
+        cycle = engine.find_arbitrage(market)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    factory().find_arbitrage(market)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": best,
+        "peak_bytes": peak_bytes,
+        "relaxations": getattr(engine, "relaxations", None),
+        "found_cycle": bool(cycle),
+    }
+
+
+def run_suite(sizes=SIZES, connectivities=tuple(CONNECTIVITY), engines=None,
+              planted=(False, True), repeat=3, max_work=None, seed=0, log=None):
+    """
+    Every engine on every seeded market; returns a JSON-ready report
+
+    One result row per (engine, currencies, connectivity, planted). Rows
+    of engines that would exceed max_work (None: each engine's default
+    from ENGINES) are kept with "skipped": true, so reports from different
+    commits always line up row for row. The full default suite takes
+    about 30 minutes on one core; pass smaller sizes (--sizes on the
+    command line) for a quick run.
+    """
+    if engines is None:
+        engines = [name for name in ENGINES
+                   if np is not None or name != "numpy_bellman_ford"]
+    results = []
+    for size in sizes:
+        for connectivity in connectivities:
+            degree = CONNECTIVITY[connectivity](size)
+            for plant_cycle in planted:
+                market = random_market(size, degree, seed, plant_cycle)
+                for engine_name in engines:
+                    _, estimate, default_work = ENGINES[engine_name]
+                    row = {
+                        "engine": engine_name,
+                        "currencies": size,
+                        "connectivity": connectivity,
+                        "degree": degree,
+                        "edges": len(market),
+                        "planted": plant_cycle,
+                    }
+                    budget = default_work if max_work is None else max_work
+                    if estimate(size, len(market), plant_cycle) > budget:
+                        row["skipped"] = True
+                    else:
+                        row.update(run_case(engine_name, market, repeat))
+                    results.append(row)
+                    if log:
+                        log(row)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "seed": seed,
+            "python_hash_seed": os.environ.get("PYTHONHASHSEED"),
+            "repeat": repeat,
+            "max_work": max_work,
+        },
+        "results": results,
+    }
+
+
+def write_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def _row_key(row):
+    return row["engine"], row["currencies"], row["connectivity"], row["planted"]
+
+
+def compare_reports(baseline, current):
+    """current / baseline time and peak memory ratios for rows run in both"""
+    previous = {_row_key(row): row for row in baseline["results"]
+                if not row.get("skipped")}
+    ratios = {}
+    for row in current["results"]:
+        old = previous.get(_row_key(row))
+        if old is None or row.get("skipped"):
+            continue
+        ratios[_row_key(row)] = {
+            "seconds": row["seconds"] / old["seconds"] if old["seconds"] else None,
+            "peak_bytes": row["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else None,
+        }
+    return ratios
+
+
+def _format_row(row):
+    label = (f"{row['engine']:>18} {row['currencies']:>5} {row['connectivity']:>6} "
+             f"{'planted' if row['planted'] else 'clean':>7} {row['edges']:>9,} edges")
+    if row.get("skipped"):
+        return f"{label}: skipped (over max_work)"
+    return (f"{label}: {row['seconds'] * 1000:10.2f} ms, "
+            f"peak {row['peak_bytes'] / 2**20:8.2f} MiB, "
+            f"relaxations {row['relaxations'] if row['relaxations'] is not None else '-':>10}")
+
+
+class TestArbitrageBenchmark:
+
+    def test_small_suite_report(self, tmp_path):
+        report = run_suite(sizes=(10, 30), repeat=1, engines=["bellman_ford", "spfa"])
+        rows = report["results"]
+        assert len(rows) == 2 * 2 * 2 * 2
+        for row in rows:
+            assert row["seconds"] > 0 and row["peak_bytes"] > 0
+            assert row["relaxations"] > 0
+            assert row["found_cycle"] == row["planted"] or row["engine"] == "bellman_ford"
+        assert all(row["found_cycle"] for row in rows
+                   if row["engine"] == "spfa" and row["planted"])
+
+        path = tmp_path / "report.json"
+        write_report(report, path)
+        loaded = json.loads(path.read_text())
+        assert loaded["results"] == rows
+        assert loaded["meta"]["seed"] == 0
+
+    def test_over_budget_engines_are_skipped(self):
+        report = run_suite(sizes=(50,), connectivities=("sparse",), planted=(False,),
+                           repeat=1, engines=["bellman_ford", "spfa"], max_work=5_000)
+        skipped = {row["engine"]: row.get("skipped", False) for row in report["results"]}
+        assert skipped == {"bellman_ford": True, "spfa": False}
+
+    def test_default_budget_covers_sparse_production_size(self):
+        _, estimate, default_work = ENGINES["bellman_ford"]
+        market = random_market(5_000, CONNECTIVITY["sparse"](5_000))
+        assert estimate(5_000, len(market), True) <= default_work
+
+    def test_report_records_hash_seed(self):
+        report = run_suite(sizes=(10,), planted=(False,), repeat=1, engines=["spfa"])
+        assert report["meta"]["python_hash_seed"] == os.environ.get("PYTHONHASHSEED")
+
+    def test_compare_reports(self):
+        baseline = run_suite(sizes=(10,), planted=(True,), repeat=1, engines=["spfa"])
+        current = json.loads(json.dumps(baseline))
+        for row in current["results"]:
+            row["seconds"] *= 2
+        ratios = compare_reports(baseline, current)
+        assert len(ratios) == 2
+        assert all(ratio["seconds"] == pytest.approx(2) for ratio in ratios.values())
+        assert all(ratio["peak_bytes"] == pytest.approx(1) for ratio in ratios.values())
+
+
+if __name__ == "__main__":
+    if os.environ.get("PYTHONHASHSEED") != HASH_SEED:
+        os.execve(sys.executable, [sys.executable] + sys.argv,
+                  {**os.environ, "PYTHONHASHSEED": HASH_SEED})
+
+    parser = argparse.ArgumentParser(description="Arbitrage detection scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-work", type=float,
+                        help="work budget for every engine (default: per engine)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="arbitrage_benchmark.json")
+    parser.add_argument("--compare", help="baseline report to compare against")
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, engines=args.engines, repeat=args.repeat,
+                       max_work=args.max_work, seed=args.seed,
+                       log=lambda row: print(_format_row(row), flush=True))
+    write_report(report, args.output)
+    print(f"report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for (engine, size, connectivity, planted), ratio in \
+                compare_reports(baseline, report).items():
+            print(f"{engine:>18} {size:>5} {connectivity:>6} "
+                  f"{'planted' if planted else 'clean':>7}: "
+                  f"time x{ratio['seconds']:.2f}, peak memory x{ratio['peak_bytes']:.2f}",
+                  file=sys.stderr)
@@ -0,0 +1,302 @@
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from test_incremental_arbitrage import IncrementalArbitrageDetector, simulated_feed
+from test_vectorized_arbitrage import random_market
+
+
+# Tick sources: async iterators of (pair, rate) -------------------------------
+
+_MALFORMED = (None, math.nan)
+
+
+def _parse(line):
+    """
+    (pair, rate) from a 'FROM TO RATE' line; None for blank and # lines
+
+    Any other unreadable line comes back as (None, nan) rather than
+    raising, so the pipeline counts it as rejected and carries on.
+    """
+    fields = line.split()
+    if not fields or fields[0].startswith("#"):
+        return None
+    if len(fields) != 3:
+        return _MALFORMED
+    try:
+        rate = float(fields[2])
+    except ValueError:
+        return _MALFORMED
+    return (fields[0], fields[1]), rate
+
+
+def write_feed(path, ticks):
+    """One 'FROM TO RATE' line per tick"""
+    with open(path, "w") as f:
+        for (from_cur, to_cur), rate in ticks:
+            f.write(f"{from_cur} {to_cur} {rate!r}\n")
+
+
+async def replay_file(path, ticks_per_sec=None):
+    """
+    File replayer standing in for the exchange feed
+
+    ticks_per_sec paces the replay (tick i is due at start + i / rate);
+    None replays as fast as the consumer allows.
+    """
+    start = time.perf_counter()
+    emitted = 0
+    with open(path) as f:
+        for line in f:
+            tick = _parse(line)
+            if tick is None:
+                continue
+            if ticks_per_sec:
+                delay = start + emitted / ticks_per_sec - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif emitted % 256 == 0:
+                await asyncio.sleep(0)
+            emitted += 1
+            yield tick
+
+
+async def read_socket(host, port):
+    """'FROM TO RATE' lines from a local TCP socket until it closes"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while line := await reader.readline():
+            tick = _parse(line.decode())
+            if tick is not None:
+                yield tick
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+# Pipeline ---------------------------------------------------------------------
+
+def _valid_tick(pair, rate):
+    try:
+        return pair is not None and 0 < rate < math.inf
+    except TypeError:
+        return False
+
+
+def percentiles(samples, points=(50, 90, 99, 100)):
+    if not samples:
+        return {point: 0.0 for point in points}
+    ordered = sorted(samples)
+    return {point: ordered[min(len(ordered) - 1, len(ordered) * point // 100)]
+            for point in points}
+
+
+class ArbitragePipeline:
+    """
+    Continuous arbitrage detection over an async tick source
+
+    source ──► ingest ──► pending {pair: (rate, first arrival)}
+                   │        (a repeated pair only overwrites its rate)
+                   └──► queue of pairs (maxsize: ingest waits when full)
+                                   │
+    detect ◄── drain up to batch_size pairs ◄┘
+       └──► run_in_executor(one worker thread): detector.update_rate(...)
+              └──► signal when a new cycle appears
+
+    - Bursts on one pair coalesce into a single update, only the latest
+      rate is ever applied
+    - The detector lives on one worker thread, so its state is never
+      touched concurrently and the event loop keeps ingesting meanwhile
+    - A tick without a pair or with a rate that is not a finite positive
+      number is counted as rejected and dropped; the feed keeps running
+    - Latency = time from a tick's arrival (the first, if coalesced) to
+      the end of the detection run that applied it; signal latency is the
+      same measure for the ticks that produced a signal
+    """
+
+    def __init__(self, detector=None, max_pending=1_024, batch_size=256):
+        self.detector = detector or IncrementalArbitrageDetector()
+        self.max_pending = max_pending
+        self.queue = None  # created in run(), on the loop that uses it
+        self.batch_size = batch_size
+        self.pending = {}
+        self.ticks = 0
+        self.rejected = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.latencies = []
+        self.signals = []  # (cycle, latency)
+        self._last_cycle = []
+
+    async def _ingest(self, source):
+        async for pair, rate in source:
+            self.ticks += 1
+            if not _valid_tick(pair, rate):
+                self.rejected += 1
+                continue
+            now = time.perf_counter()
+            if pair in self.pending:
+                self.pending[pair] = (rate, self.pending[pair][1])
+                self.coalesced += 1
+                continue
+            self.pending[pair] = (rate, now)
+            await self.queue.put(pair)
+        await self.queue.put(None)
+
+    def _apply(self, batch):
+        """Runs on the worker thread; returns (cycle or [], arrival) per update"""
+        return [(self.detector.update_rate(pair, rate), arrival)
+                for pair, rate, arrival in batch]
+
+    async def _detect(self, executor):
+        loop = asyncio.get_running_loop()
+        finished = False
+        while not finished:
+            pairs = [await self.queue.get()]
+            while len(pairs) < self.batch_size and not self.queue.empty():
+                pairs.append(self.queue.get_nowait())
+            if pairs[-1] is None:
+                finished = True
+                pairs.pop()
+            batch = [(pair, *self.pending.pop(pair)) for pair in pairs]
+            if not batch:
+                continue
+
+            results = await loop.run_in_executor(executor, self._apply, batch)
+            done = time.perf_counter()
+            self.batches += 1
+            for cycle, arrival in results:
+                self.latencies.append(done - arrival)
+                if cycle and cycle != self._last_cycle:
+                    self.signals.append((cycle, done - arrival))
+                self._last_cycle = cycle
+
+    async def run(self, source):
+        self.queue = asyncio.Queue(self.max_pending)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await asyncio.gather(self._ingest(source), self._detect(executor))
+        return self.report()
+
+    def report(self):
+        return {
+            "ticks": self.ticks,
+            "rejected": self.rejected,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "signals": len(self.signals),
+            "latency": percentiles(self.latencies),
+            "signal_latency": percentiles([latency for _, latency in self.signals]),
+        }
+
+
+def bursty_feed(market, num_ticks, burst=4, seed=0, shock_every=200):
+    """simulated_feed with every tick repeated burst times in a row"""
+    ticks = simulated_feed(market, num_ticks // burst, seed, shock_every)
+    return [tick for tick in ticks for _ in range(burst)]
+
+
+def measure_pipeline(path, num_currencies=100, degree=6, num_ticks=40_000,
+                     ticks_per_sec=None):
+    """Replay a bursty feed from path through the pipeline; its report + ticks/s"""
+    market = random_market(num_currencies, degree)
+    write_feed(path, bursty_feed(market, num_ticks))
+    pipeline = ArbitragePipeline(IncrementalArbitrageDetector(market))
+    start = time.perf_counter()
+    report = asyncio.run(pipeline.run(replay_file(path, ticks_per_sec)))
+    report["ticks_per_sec"] = report["ticks"] / (time.perf_counter() - start)
+    return report
+
+
+class TestArbitragePipeline:
+
+    def test_signal_from_file_replay(self, tmp_path):
+        path = tmp_path / "feed.txt"
+        write_feed(path, [(('USD', 'EUR'), 0.85), (('EUR', 'GBP'), 0.90),
+                          (('GBP', 'USD'), 1.30), (('GBP', 'USD'), 1.5)])
+        with open(path, "a") as f:
+            f.write("# comment\n\n")
+        report = asyncio.run(ArbitragePipeline(batch_size=1).run(replay_file(path)))
+        assert report["ticks"] == 4
+        assert report["signals"] == 1
+
+    def test_bad_ticks_are_rejected_not_fatal(self, tmp_path):
+        path = tmp_path / "feed.txt"
+        path.write_text("USD EUR n/a\nUSD EUR\nUSD EUR 0.8\nEUR GBP 0\n"
+                        "EUR GBP -1\nEUR GBP nan\nEUR GBP 0.9\nGBP USD 1.5\n")
+        pipeline = ArbitragePipeline(batch_size=1)
+        report = asyncio.run(pipeline.run(replay_file(path)))
+        assert report["ticks"] == 8
+        assert report["rejected"] == 5
+        assert pipeline.signals[0][0] == ['USD', 'EUR', 'GBP', 'USD']
+
+    def test_bursts_coalesce_to_latest_rate(self):
+        async def source():
+            for rate in (0.80, 0.85, 0.90):
+                yield ('USD', 'EUR'), rate
+
+        pipeline = ArbitragePipeline()
+        report = asyncio.run(pipeline.run(source()))
+        assert report["ticks"] == 3
+        assert report["coalesced"] == 2
+        assert pipeline.detector.graph['USD']['EUR'] == pytest.approx(-math.log(0.90))
+
+    def test_backpressure_bounds_the_queue(self):
+        sizes = []
+
+        async def source(pipeline):
+            for i in range(200):
+                sizes.append(pipeline.queue.qsize())
+                yield ('C0', f'C{i + 1}'), 1.0
+
+        pipeline = ArbitragePipeline(max_pending=8, batch_size=4)
+        asyncio.run(pipeline.run(source(pipeline)))
+        assert max(sizes) <= 8
+        assert pipeline.batches >= 200 // 4
+
+    def test_socket_source(self):
+        lines = b"USD EUR 0.8\nEUR GBP 0.9\nGBP USD 1.5\n"
+
+        async def scenario():
+            async def serve(reader, writer):
+                writer.write(lines)
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                pipeline = ArbitragePipeline()
+                report = await pipeline.run(read_socket("127.0.0.1", port))
+            return pipeline, report
+
+        pipeline, report = asyncio.run(scenario())
+        assert report["ticks"] == 3
+        assert pipeline.signals[0][0] == ['USD', 'EUR', 'GBP', 'USD']
+
+    def test_latency_report(self, tmp_path):
+        report = measure_pipeline(tmp_path / "feed.txt", num_currencies=30,
+                                  num_ticks=2_000)
+        assert report["ticks"] == 2_000
+        assert report["coalesced"] > 0
+        latency = report["latency"]
+        assert 0 < latency[50] <= latency[90] <= latency[99] <= latency[100]
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "feed.txt")
+        for pace in (None, 20_000):
+            report = measure_pipeline(path, ticks_per_sec=pace)
+            label = "unpaced" if pace is None else f"{pace:,} ticks/s paced"
+            print(f"{label}: {report['ticks_per_sec']:,.0f} ticks/s, "
+                  f"{report['coalesced']:,} coalesced, {report['rejected']:,} rejected, "
+                  f"{report['batches']:,} batches, "
+                  f"{report['signals']} signals")
+            print("  tick→signal latency ms: " + ", ".join(
+                f"p{point} {seconds * 1000:.2f}"
+                for point, seconds in report["latency"].items()))
@@ -0,0 +1,234 @@
+import math
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from collections import deque
+
+import pytest
+
+from test_spfa_arbitrage import SPFACurrencyArbitrage
+from test_vectorized_arbitrage import random_market
+
+
+# Pool worker side: the pair universe arrives once per process
+# (initializer), every task after that is one flat array of rates.
+_universe = None
+
+
+def _init_worker(pairs):
+    global _universe
+    _universe = pairs
+
+
+def _solve_chunk(payload):
+    return _solve_rows(_universe, payload)
+
+
+def _solve_rows(pairs, payload):
+    rates = array('d')
+    rates.frombytes(payload)
+    width = len(pairs)
+    engine = SPFACurrencyArbitrage()
+    results = []
+    for offset in range(0, len(rates), width):
+        row = rates[offset:offset + width]
+        snapshot = {pair: rate for pair, rate in zip(pairs, row)
+                    if not math.isnan(rate)}
+        results.append(engine.find_arbitrage(snapshot))
+    return results
+
+
+class BatchCurrencyArbitrage:
+    """
+    find_arbitrage over many rate snapshots sharing one currency universe
+
+    parent                                       worker (× processes)
+    ======                                       ====================
+    pairs = [(USD, EUR), (EUR, GBP), ...] ──once──► initializer
+    snapshot dict ──► row of rates, NaN = no quote
+    chunk_size rows ──► array('d').tobytes() ──────► rebuild dicts, SPFA
+    ordered results ◄────────── cycles ◄──────────┘
+
+    - Currency names are pickled once per worker, not once per snapshot;
+      a task is just chunk_size × len(pairs) doubles
+    - Results come back in input order; at most 2 × workers chunks are
+      in flight, so a long stream of snapshots is never held in memory
+    - workers=1 runs the same chunked code in-process (no pool)
+    """
+
+    def __init__(self, workers=None, chunk_size=256):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must larger than 0")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def _encode(self, snapshots, index):
+        """Yield chunk_size snapshots at a time as bytes of aligned rates"""
+        width = len(index)
+        chunk = array('d')
+        for snapshot in snapshots:
+            row = [math.nan] * width
+            for pair, rate in snapshot.items():
+                position = index.get(pair)
+                if position is None:
+                    raise ValueError(f"Pair {pair} is outside the shared universe")
+                row[position] = rate
+            chunk.extend(row)
+            if len(chunk) == width * self.chunk_size:
+                yield chunk.tobytes()
+                chunk = array('d')
+        if chunk:
+            yield chunk.tobytes()
+
+    def iter_arbitrage(self, snapshots, pairs=None):
+        """
+        Args:
+            snapshots: iterable of {(from, to): rate} dicts
+            pairs: the shared universe of currency pairs; by default the
+                   pairs quoted in the first snapshot
+
+        Yields:
+            One arbitrage cycle (or []) per snapshot, in input order
+        """
+        snapshots = iter(snapshots)
+        if pairs is None:
+            first = next(snapshots, None)
+            if first is None:
+                return
+            pairs = list(first)
+            snapshots = _chain_first(first, snapshots)
+        pairs = list(pairs)
+        if not pairs:
+            # nothing to encode, but a quoted pair is still out of universe
+            for snapshot in snapshots:
+                for pair in snapshot:
+                    raise ValueError(f"Pair {pair} is outside the shared universe")
+                yield []
+            return
+        index = {pair: position for position, pair in enumerate(pairs)}
+        chunks = self._encode(snapshots, index)
+
+        if self.workers == 1:
+            # pairs passed explicitly: interleaved generators in this
+            # process must not share the pool workers' global universe
+            for payload in chunks:
+                yield from _solve_rows(pairs, payload)
+            return
+
+        with multiprocessing.Pool(self.workers, _init_worker, (pairs,)) as pool:
+            in_flight = deque()
+            for payload in chunks:
+                in_flight.append(pool.apply_async(_solve_chunk, (payload,)))
+                if len(in_flight) >= 2 * self.workers:
+                    yield from in_flight.popleft().get()
+            while in_flight:
+                yield from in_flight.popleft().get()
+
+    def find_arbitrage_batch(self, snapshots, pairs=None):
+        return list(self.iter_arbitrage(snapshots, pairs))
+
+
+def _chain_first(first, rest):
+    yield first
+    yield from rest
+
+
+def snapshot_series(num_snapshots, num_currencies=30, degree=6, seed=0,
+                    plant_every=0):
+    """Jittered copies of one market; every plant_every-th one has an arbitrage"""
+    rng = random.Random(seed)
+    base = random_market(num_currencies, degree, seed)
+    planted = random_market(num_currencies, degree, seed, plant_cycle=True)
+    series = []
+    for i in range(num_snapshots):
+        source = planted if plant_every and i % plant_every == 0 else base
+        series.append({pair: rate * rng.uniform(0.9995, 1.0)
+                       for pair, rate in source.items()})
+    return series
+
+
+def _solve_one(snapshot):
+    return SPFACurrencyArbitrage().find_arbitrage(snapshot)
+
+
+def compare_batch(num_snapshots=4_000, num_currencies=30, workers=None):
+    """Snapshots/s: serial loop, one pickled dict per task, chunked batch API"""
+    series = snapshot_series(num_snapshots, num_currencies, plant_every=10)
+    workers = workers or os.cpu_count() or 1
+    report = {"workers": workers}
+
+    start = time.perf_counter()
+    expected = [_solve_one(snapshot) for snapshot in series]
+    report["serial"] = num_snapshots / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        per_dict = pool.map(_solve_one, series, chunksize=1)
+    report["dict_per_task"] = num_snapshots / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    batched = BatchCurrencyArbitrage(workers).find_arbitrage_batch(series)
+    report["batch"] = num_snapshots / (time.perf_counter() - start)
+
+    assert per_dict == batched == expected
+    return report
+
+
+class TestBatchCurrencyArbitrage:
+
+    def test_matches_serial_in_order(self):
+        series = snapshot_series(50, num_currencies=12, degree=4, plant_every=3)
+        expected = [SPFACurrencyArbitrage().find_arbitrage(s) for s in series]
+        for workers in (1, 2):
+            batch = BatchCurrencyArbitrage(workers=workers, chunk_size=7)
+            assert batch.find_arbitrage_batch(iter(series)) == expected
+        assert expected[0] == ['C0', 'C1', 'C2', 'C0']
+        assert expected[1] == []
+
+    def test_missing_quotes_and_explicit_universe(self):
+        pairs = [('USD', 'EUR'), ('EUR', 'GBP'), ('GBP', 'USD'), ('EUR', 'USD')]
+        snapshots = [
+            {('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9, ('GBP', 'USD'): 1.5},
+            {('USD', 'EUR'): 0.8, ('EUR', 'USD'): 1.3},
+            {('EUR', 'GBP'): 0.9},
+        ]
+        batch = BatchCurrencyArbitrage(workers=1, chunk_size=2)
+        assert batch.find_arbitrage_batch(snapshots, pairs) == [
+            ['USD', 'EUR', 'GBP', 'USD'], ['USD', 'EUR', 'USD'], []]
+
+    def test_pair_outside_universe(self):
+        snapshots = [{('USD', 'EUR'): 0.8}, {('USD', 'JPY'): 150}]
+        with pytest.raises(ValueError):
+            BatchCurrencyArbitrage(workers=1).find_arbitrage_batch(snapshots)
+
+    def test_interleaved_generators_keep_their_universe(self):
+        triangle = {('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9, ('GBP', 'USD'): 1.5}
+        other = {('JPY', 'CHF'): 0.006, ('CHF', 'JPY'): 160}
+        batch = BatchCurrencyArbitrage(workers=1, chunk_size=1)
+        first = batch.iter_arbitrage([triangle] * 3)
+        second = batch.iter_arbitrage([other] * 3)
+        for _ in range(3):
+            assert next(first) == ['USD', 'EUR', 'GBP', 'USD']
+            assert next(second) == []
+
+    def test_empty_inputs(self):
+        batch = BatchCurrencyArbitrage(workers=1)
+        assert batch.find_arbitrage_batch([]) == []
+        assert batch.find_arbitrage_batch([{}, {}]) == [[], []]
+        assert batch.find_arbitrage_batch([{}], pairs=[]) == [[]]
+        triangle = {('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9, ('GBP', 'USD'): 1.5}
+        with pytest.raises(ValueError):
+            batch.find_arbitrage_batch([{}, triangle])
+        with pytest.raises(ValueError):
+            batch.find_arbitrage_batch([triangle], pairs=[])
+        with pytest.raises(ValueError):
+            BatchCurrencyArbitrage(chunk_size=0)
+
+
+if __name__ == "__main__":
+    report = compare_batch()
+    print(f"{report.pop('workers')} worker processes")
+    for name, per_sec in report.items():
+        print(f"{name:>13}: {per_sec:>10,.0f} snapshots/s")
@@ -4,7 +4,7 @@ from collections import defaultdict
 
 class CurrencyTriangleArbitrage:
     def __init__(self):
-        pass
+        self.relaxations = 0
     
     def find_arbitrage(self, exchange_rates):
         """
@@ -33,6 +33,7 @@ class CurrencyTriangleArbitrage:
         distances = {cur: float('inf') for cur in currencies}
         predecessors = {cur: None for cur in currencies}
         distances[currencies[0]] = 0
+        self.relaxations = 0
 
         # Bellman-Ford: relax edges V-1 times
         for _ in range(len(currencies) - 1):
@@ -42,6 +43,7 @@ class CurrencyTriangleArbitrage:
                         if distances[cur] + weight < distances[nei]:
                             distances[nei] = distances[cur] + weight
                             predecessors[nei] = cur
+                            self.relaxations += 1
 
         # Check for negative cycles
         for cur in currencies:
@@ -0,0 +1,196 @@
+import itertools
+import math
+import time
+
+import pytest
+
+from test_ranked_arbitrage import RankedCurrencyArbitrage, noisy_market
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, only the dense path needs it
+    np = None
+
+
+class DenseTriangleArbitrage(RankedCurrencyArbitrage):
+    """
+    Every profitable three-currency cycle, ranked by profit
+
+    DENSE PATH (N×N matrix, blocked broadcasting):
+    ==============================================
+
+    L[a, b] = log(rate a → b), -inf where there is no quote
+
+    for a block of rows I (block currencies at a time):
+      S[i, j, k] = L[i, j] + L[j, k] + L[k, i]      shape (block, N, N)
+      profitable triangle  ⇔  S > 0
+
+    Memory is O(N²·block) instead of the O(N³) full tensor. Each triangle
+    shows up three times (once per rotation); only the rotation that
+    starts at its smallest index (i < j, i < k) is kept.
+
+    SPARSE PATH: walk a → b → c over the adjacency sets and check the
+    closing quote c → a, so the cost follows the number of edges.
+
+    find_triangles picks the dense path once the market quotes at least
+    dense_threshold of all N·(N-1) possible pairs (and NumPy is present);
+    the two paths break even at roughly 20% density.
+    """
+
+    def __init__(self, block=8, dense_threshold=0.2):
+        super().__init__()
+        self.block = block
+        self.dense_threshold = dense_threshold
+        self.last_path = None
+
+    def _intern(self, exchange_rates):
+        index = {}
+        for pair in exchange_rates:
+            for currency in pair:
+                index.setdefault(currency, len(index))
+        return index
+
+    def _dense_triangles(self, exchange_rates, index):
+        n = len(index)
+        log_rates = np.full((n, n), -np.inf)
+        rows = np.fromiter((index[a] for a, _ in exchange_rates), dtype=np.int64,
+                           count=len(exchange_rates))
+        cols = np.fromiter((index[b] for _, b in exchange_rates), dtype=np.int64,
+                           count=len(exchange_rates))
+        log_rates[rows, cols] = np.log(np.fromiter(exchange_rates.values(),
+                                                   dtype=np.float64,
+                                                   count=len(exchange_rates)))
+        np.fill_diagonal(log_rates, -np.inf)
+
+        found = []
+        for start in range(0, n, self.block):
+            stop = min(start + self.block, n)
+            # a canonical triangle has j, k > i >= start: skip the rest
+            rest = log_rates[start:, start:]
+            legs = rest[:stop - start, :, None] + rest[None, :, :]   # L[i, j] + L[j, k]
+            legs += rest[:, :stop - start].T[:, None, :]             # + L[k, i]
+            bi, j, k = np.nonzero(legs > 0)
+            keep = (j > bi) & (k > bi)
+            bi, j, k = bi[keep], j[keep], k[keep]
+            found.append((legs[bi, j, k], bi + start, j + start, k + start))
+        totals, i, j, k = (np.concatenate(column) for column in zip(*found))
+        return list(zip(totals.tolist(), i.tolist(), j.tolist(), k.tolist()))
+
+    def _sparse_triangles(self, exchange_rates, index):
+        adjacency = [dict() for _ in index]
+        for (from_cur, to_cur), rate in exchange_rates.items():
+            if from_cur != to_cur:
+                adjacency[index[from_cur]][index[to_cur]] = math.log(rate)
+
+        found = []
+        for i, out_i in enumerate(adjacency):
+            for j, ij in out_i.items():
+                if j < i:
+                    continue
+                for k, jk in adjacency[j].items():
+                    if k > i and i in adjacency[k]:
+                        total = ij + jk + adjacency[k][i]
+                        if total > 0:
+                            found.append((total, i, j, k))
+        return found
+
+    def find_triangles(self, exchange_rates, k=None):
+        """
+        Returns:
+            (profit, cycle) for every profitable triangle, most profitable
+            first (only the top k when k is given)
+        """
+        index = self._intern(exchange_rates)
+        n = len(index)
+        if n < 3:
+            return []
+        density = len(exchange_rates) / (n * (n - 1))
+        if np is not None and density >= self.dense_threshold:
+            self.last_path = "dense"
+            found = self._dense_triangles(exchange_rates, index)
+        else:
+            self.last_path = "sparse"
+            found = self._sparse_triangles(exchange_rates, index)
+
+        names = list(index)
+        found.sort(key=lambda entry: entry[0], reverse=True)
+        if k is not None:
+            found = found[:k]
+        return [(math.exp(total), self._rotate([names[i], names[j], names[c]]))
+                for total, i, j, c in found]
+
+
+def compare_paths(cases=((200, 8), (200, 32), (400, 32), (400, 128), (800, 400)),
+                  spread=(0.98, 1.001), seed=0):
+    """Seconds per find_triangles call on each path, by market size and degree"""
+    report = {}
+    for size, degree in cases:
+        market = noisy_market(size, degree, seed, spread)
+        row = {"density": len(market) / (size * (size - 1))}
+        for name, threshold in [("sparse", 2.0), ("dense", 0.0), ("auto", 0.2)]:
+            engine = DenseTriangleArbitrage(dense_threshold=threshold)
+            start = time.perf_counter()
+            row["triangles"] = len(engine.find_triangles(market))
+            row[name] = time.perf_counter() - start
+        report[(size, degree)] = row
+    return report
+
+
+class TestDenseTriangleArbitrage:
+
+    def setup_method(self):
+        pytest.importorskip("numpy")
+        self.dense = DenseTriangleArbitrage(block=4, dense_threshold=0.0)
+        self.sparse = DenseTriangleArbitrage(dense_threshold=2.0)
+
+    def test_simple_triangle(self):
+        exchange_rates = {('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9,
+                          ('GBP', 'USD'): 1.5}
+        for engine in (self.dense, self.sparse):
+            [(profit, cycle)] = engine.find_triangles(exchange_rates)
+            assert cycle == ['USD', 'EUR', 'GBP', 'USD']
+            assert profit == pytest.approx(0.8 * 0.9 * 1.5)
+
+    def test_ignores_longer_cycles_and_clean_markets(self):
+        four_cycle = {('USD', 'EUR'): 0.8, ('EUR', 'JPY'): 130,
+                      ('JPY', 'GBP'): 0.007, ('GBP', 'USD'): 1.4}
+        clean = {('USD', 'EUR'): 0.85, ('EUR', 'GBP'): 0.90, ('GBP', 'USD'): 1.30}
+        for engine in (self.dense, self.sparse):
+            assert engine.find_triangles(four_cycle) == []
+            assert engine.find_triangles(clean) == []
+            assert engine.find_triangles({}) == []
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_paths_agree_with_brute_force(self, seed):
+        market = noisy_market(10, degree=6, seed=seed, spread=(0.97, 1.03))
+        expected = sorted(
+            (market[(a, b)] * market[(b, c)] * market[(c, a)]
+             for a, b, c in itertools.permutations(sorted({x for p in market for x in p}), 3)
+             if a < b and a < c and (a, b) in market and (b, c) in market
+             and (c, a) in market and market[(a, b)] * market[(b, c)] * market[(c, a)] > 1),
+            reverse=True)
+        dense = self.dense.find_triangles(market)
+        sparse = self.sparse.find_triangles(market)
+        assert expected
+        assert [profit for profit, _ in dense] == pytest.approx(expected)
+        assert [cycle for _, cycle in dense] == [cycle for _, cycle in sparse]
+
+    def test_top_k(self):
+        market = noisy_market(30, degree=10, seed=4)
+        all_triangles = self.dense.find_triangles(market)
+        assert self.dense.find_triangles(market, k=3) == all_triangles[:3]
+
+    def test_automatic_path_choice(self):
+        engine = DenseTriangleArbitrage()
+        engine.find_triangles(noisy_market(200, degree=3))
+        assert engine.last_path == "sparse"
+        engine.find_triangles(noisy_market(50, degree=20))
+        assert engine.last_path == "dense"
+
+
+if __name__ == "__main__":
+    for (size, degree), row in compare_paths().items():
+        print(f"{size:>5} currencies, degree {degree:>4} "
+              f"(density {row['density']:.2f}, {row['triangles']:>6} triangles): "
+              f"sparse {row['sparse'] * 1000:8.1f} ms, dense {row['dense'] * 1000:8.1f} ms, "
+              f"auto {row['auto'] * 1000:8.1f} ms")
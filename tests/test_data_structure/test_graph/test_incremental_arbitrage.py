@@ -0,0 +1,219 @@
+import math
+import random
+import time
+from collections import defaultdict, deque
+
+import pytest
+
+from test_currency_triangle_arbitrage import CurrencyTriangleArbitrage
+from test_spfa_arbitrage import SPFACurrencyArbitrage
+from test_vectorized_arbitrage import random_market
+
+
+class IncrementalArbitrageDetector(SPFACurrencyArbitrage):
+    """
+    Stateful arbitrage detector for a stream of single-pair rate ticks
+
+    Keeps the graph and distance labels d between ticks. While there is
+    no arbitrage, d satisfies d[v] <= d[u] + w(u, v) on every edge.
+
+    update_rate((u, v), rate) with new weight w = -log(rate):
+
+    - d[u] + w >= d[v]: every edge is still satisfied, nothing to do
+      (this covers every rate that got worse)
+    - otherwise lower d[v] and propagate from v only. Any new negative
+      cycle must use edge u → v, so it shows up as soon as the
+      propagation comes back and lowers d[v] again
+
+    After a cycle is reported the labels are no longer valid ("dirty").
+    Ticks that leave the cycle's edges unchanged or better cannot remove
+    it, so the same cycle is reported again for free; only a tick making
+    one of its rates worse pays for a full SPFA recompute.
+    """
+
+    def __init__(self, exchange_rates=None):
+        super().__init__()
+        self.graph = defaultdict(dict)
+        self.distances = {}
+        self.predecessors = {}
+        self.dirty = False
+        self.cycle = []
+        for (from_cur, to_cur), rate in (exchange_rates or {}).items():
+            self._set_edge(from_cur, to_cur, rate)
+        self._recompute()
+
+    def _set_edge(self, from_cur, to_cur, rate):
+        if rate <= 0:
+            raise ValueError("Exchange rate must larger than 0")
+        for cur in (from_cur, to_cur):
+            if cur not in self.distances:
+                self.distances[cur] = 0.0
+                self.predecessors[cur] = None
+                self.graph.setdefault(cur, {})
+        weight = -math.log(rate)
+        previous = self.graph[from_cur].get(to_cur, math.inf)
+        self.graph[from_cur][to_cur] = weight
+        return weight, previous
+
+    def _propagate(self, queue, watched=None):
+        """
+        SPFA from the queued currencies
+
+        watched: the currency whose label was just lowered; lowering it
+        again closes a negative cycle. Without it (full recompute), a
+        currency relaxed V times triggers a predecessor cycle check.
+        """
+        distances, predecessors, graph = self.distances, self.predecessors, self.graph
+        n = len(distances)
+        in_queue = set(queue)
+        relax_count = defaultdict(int)
+        while queue:
+            cur = queue.popleft()
+            in_queue.discard(cur)
+            for nei, weight in graph[cur].items():
+                if distances[cur] + weight < distances[nei]:
+                    distances[nei] = distances[cur] + weight
+                    predecessors[nei] = cur
+                    self.relaxations += 1
+
+                    on_cycle = None
+                    if nei == watched:
+                        on_cycle = nei
+                    elif watched is None:
+                        relax_count[nei] += 1
+                        if relax_count[nei] >= n:
+                            on_cycle = self._cycle_in_predecessors(nei, predecessors)
+                    if on_cycle is not None:
+                        self.dirty = True
+                        self.cycle = self._reconstruct_cycle(on_cycle, predecessors)
+                        return self.cycle
+
+                    if nei not in in_queue:
+                        queue.append(nei)
+                        in_queue.add(nei)
+        self.dirty = False
+        self.cycle = []
+        return []
+
+    def _recompute(self):
+        for cur in self.distances:
+            self.distances[cur] = 0.0
+            self.predecessors[cur] = None
+        return self._propagate(deque(self.distances))
+
+    def update_rate(self, pair, rate):
+        """Apply one tick; return an arbitrage cycle or [] like find_arbitrage"""
+        from_cur, to_cur = pair
+        weight, previous = self._set_edge(from_cur, to_cur, rate)
+        self.relaxations = 0
+        if self.dirty:
+            if weight <= previous or pair not in zip(self.cycle, self.cycle[1:]):
+                return self.cycle
+            return self._recompute()
+
+        candidate = self.distances[from_cur] + weight
+        if candidate >= self.distances[to_cur]:
+            return []
+        self.distances[to_cur] = candidate
+        self.predecessors[to_cur] = from_cur
+        return self._propagate(deque([to_cur]), watched=to_cur)
+
+
+def simulated_feed(market, num_ticks, seed=0, shock_every=0):
+    """
+    Ticks (pair, rate) jittering existing rates by a few basis points
+
+    shock_every=k makes every k-th tick a rate 3% too generous, which
+    usually opens an arbitrage; the next tick quotes that pair back.
+    """
+    rng = random.Random(seed)
+    pairs = list(market)
+    ticks = []
+    for i in range(num_ticks):
+        if shock_every and i % shock_every == 0 and ticks:
+            pair = ticks[-1][0]
+            ticks.append((pair, market[pair]))
+            continue
+        pair = rng.choice(pairs)
+        rate = market[pair] * rng.uniform(0.9995, 1.0)
+        if shock_every and i % shock_every == shock_every - 1:
+            rate = market[pair] * 1.03
+        ticks.append((pair, rate))
+    return ticks
+
+
+def compare_tick_throughput(num_currencies=200, degree=8, num_ticks=2_000):
+    """Ticks/s: incremental detector vs full SPFA and full Bellman-Ford per tick"""
+    market = random_market(num_currencies, degree)
+    ticks = simulated_feed(market, num_ticks, shock_every=50)
+    report = {}
+
+    detector = IncrementalArbitrageDetector(market)
+    start = time.perf_counter()
+    for pair, rate in ticks:
+        detector.update_rate(pair, rate)
+    report["incremental"] = num_ticks / (time.perf_counter() - start)
+
+    # full recomputes are far slower; time them on every 10th tick
+    for name, engine in [("full_spfa", SPFACurrencyArbitrage()),
+                         ("full_bellman_ford", CurrencyTriangleArbitrage())]:
+        rates = dict(market)
+        elapsed = 0.0
+        for i, (pair, rate) in enumerate(ticks):
+            rates[pair] = rate
+            if i % 10 == 0:
+                start = time.perf_counter()
+                engine.find_arbitrage(rates)
+                elapsed += time.perf_counter() - start
+        report[name] = len(ticks[::10]) / elapsed
+    return report
+
+
+class TestIncrementalArbitrageDetector:
+
+    def test_tick_opens_and_closes_arbitrage(self):
+        detector = IncrementalArbitrageDetector({
+            ('USD', 'EUR'): 0.85, ('EUR', 'GBP'): 0.90, ('GBP', 'USD'): 1.30})
+        assert detector.update_rate(('GBP', 'USD'), 1.29) == []
+        assert detector.update_rate(('GBP', 'USD'), 1.5) == ['USD', 'EUR', 'GBP', 'USD']
+        assert detector.dirty
+        assert detector.update_rate(('USD', 'EUR'), 0.86) == ['USD', 'EUR', 'GBP', 'USD']
+        assert detector.update_rate(('USD', 'EUR'), 0.85) == ['USD', 'EUR', 'GBP', 'USD']
+        assert detector.update_rate(('GBP', 'USD'), 1.30) == []
+        assert not detector.dirty
+
+    def test_new_currency_from_tick(self):
+        detector = IncrementalArbitrageDetector()
+        assert detector.update_rate(('USD', 'JPY'), 150) == []
+        assert detector.update_rate(('JPY', 'USD'), 0.007) == ['USD', 'JPY', 'USD']
+
+    def test_worse_rate_does_no_work(self):
+        detector = IncrementalArbitrageDetector(random_market(50, seed=3))
+        pair = next(iter(detector.graph['C0']))
+        assert detector.update_rate(('C0', pair), 1e-9) == []
+        assert detector.relaxations == 0
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            IncrementalArbitrageDetector().update_rate(('USD', 'EUR'), 0)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_agrees_with_full_recompute_on_feed(self, seed):
+        market = random_market(40, degree=4, seed=seed)
+        detector = IncrementalArbitrageDetector(market)
+        full = SPFACurrencyArbitrage()
+        rates = dict(market)
+        for pair, rate in simulated_feed(market, 300, seed=seed, shock_every=7):
+            rates[pair] = rate
+            incremental_cycle = detector.update_rate(pair, rate)
+            assert bool(incremental_cycle) == bool(full.find_arbitrage(rates))
+            if incremental_cycle:
+                profit = 1.0
+                for a, b in zip(incremental_cycle, incremental_cycle[1:]):
+                    profit *= rates[(a, b)]
+                assert profit > 1
+
+
+if __name__ == "__main__":
+    for name, ticks_per_sec in compare_tick_throughput().items():
+        print(f"{name:>17}: {ticks_per_sec:>10,.0f} ticks/s")
@@ -0,0 +1,278 @@
+import math
+import time
+from collections import deque
+
+import pytest
+
+from test_spfa_arbitrage import SPFACurrencyArbitrage
+from test_vectorized_arbitrage import random_market
+
+
+class MarketGraph:
+    """
+    Reusable market graph: interned currency ids + CSR adjacency
+
+    currencies: ['USD', 'EUR', 'GBP']         index: {'USD': 0, 'EUR': 1, ...}
+
+    offsets: [0, 2, 3, 4]          edges of u = offsets[u] .. offsets[u+1]-1
+    targets: [1, 2, 2, 0]
+    weights: [-log r, ...]         (parallel to targets)
+
+    - Built once; detectors read the arrays and keep per-call state in
+      flat lists indexed by id instead of dicts keyed by strings
+    - update_rate on an already quoted pair rewrites one weight in place;
+      a new pair only marks the CSR arrays stale, rebuilt on next use
+    - The arrays are plain lists: CPython hands out list items without
+      boxing a fresh int/float per read, ~25% faster than array('d')
+    """
+
+    def __init__(self, exchange_rates=None):
+        self.currencies = []
+        self.index = {}
+        self.rates = {}
+        self.edge_position = {}
+        self.offsets = [0]
+        self.targets = []
+        self.weights = []
+        self.stale = False
+        for pair, rate in (exchange_rates or {}).items():
+            self._add(pair, rate)
+        self._build()
+
+    def __len__(self):
+        return len(self.currencies)
+
+    def _intern(self, currency):
+        cid = self.index.get(currency)
+        if cid is None:
+            cid = self.index[currency] = len(self.currencies)
+            self.currencies.append(currency)
+        return cid
+
+    def _add(self, pair, rate):
+        if rate <= 0:
+            raise ValueError("Exchange rate must larger than 0")
+        self.rates[(self._intern(pair[0]), self._intern(pair[1]))] = rate
+
+    def _build(self):
+        n = len(self.currencies)
+        counts = [0] * (n + 1)
+        for src, _ in self.rates:
+            counts[src + 1] += 1
+        for cid in range(n):
+            counts[cid + 1] += counts[cid]
+        self.offsets = counts
+
+        fill = counts[:-1]
+        targets = [0] * len(self.rates)
+        weights = [0.0] * len(self.rates)
+        self.edge_position = {}
+        for (src, dst), rate in self.rates.items():
+            position = fill[src]
+            fill[src] += 1
+            targets[position] = dst
+            weights[position] = -math.log(rate)
+            self.edge_position[(src, dst)] = position
+        self.targets = targets
+        self.weights = weights
+        self.stale = False
+
+    def ensure_built(self):
+        if self.stale:
+            self._build()
+
+    def update_rate(self, pair, rate):
+        known = pair[0] in self.index and pair[1] in self.index
+        self._add(pair, rate)
+        key = (self.index[pair[0]], self.index[pair[1]])
+        position = self.edge_position.get(key) if known else None
+        if position is None:
+            self.stale = True
+        else:
+            self.weights[position] = -math.log(rate)
+
+    def to_rates(self):
+        names = self.currencies
+        return {(names[src], names[dst]): rate for (src, dst), rate in self.rates.items()}
+
+
+class CSRCurrencyArbitrage(SPFACurrencyArbitrage):
+    """
+    SPFA over a MarketGraph: ids and CSR arrays instead of string dicts
+
+    Same search and same cycles as SPFACurrencyArbitrage (currencies and
+    edges are visited in the same order); names only come back when a
+    cycle is found and formatted by _reconstruct_cycle.
+    """
+
+    def find_arbitrage(self, market):
+        if not isinstance(market, MarketGraph):
+            market = MarketGraph(market)
+        market.ensure_built()
+        n = len(market)
+        offsets, targets, weights = market.offsets, market.targets, market.weights
+        distances = [0.0] * n
+        predecessors = [-1] * n
+        relax_count = [0] * n
+        queue = deque(range(n))
+        in_queue = [True] * n
+        budget = self.budget
+        if budget is None:
+            budget = n * max(1, len(targets))
+        relaxations = 0
+
+        while queue:
+            cur = queue.popleft()
+            in_queue[cur] = False
+            base = distances[cur]
+            for position in range(offsets[cur], offsets[cur + 1]):
+                nei = targets[position]
+                candidate = base + weights[position]
+                if candidate < distances[nei]:
+                    distances[nei] = candidate
+                    predecessors[nei] = cur
+                    relax_count[nei] += 1
+                    relaxations += 1
+
+                    if relax_count[nei] >= n:
+                        cycle = self._named_cycle(market, nei, predecessors)
+                        if cycle:
+                            self.relaxations = relaxations
+                            return cycle
+                    if relaxations > budget:
+                        return self._csr_bellman_ford(market, relaxations)
+                    if not in_queue[nei]:
+                        queue.append(nei)
+                        in_queue[nei] = True
+        self.relaxations = relaxations
+        return []
+
+    def _csr_bellman_ford(self, market, relaxations):
+        """SPFACurrencyArbitrage._bellman_ford over the CSR arrays"""
+        n = len(market)
+        offsets, targets, weights = market.offsets, market.targets, market.weights
+        distances = [0.0] * n
+        predecessors = [-1] * n
+        for _ in range(n):
+            improved = -1
+            for cur in range(n):
+                base = distances[cur]
+                for position in range(offsets[cur], offsets[cur + 1]):
+                    nei = targets[position]
+                    candidate = base + weights[position]
+                    if candidate < distances[nei]:
+                        distances[nei] = candidate
+                        predecessors[nei] = cur
+                        relaxations += 1
+                        improved = nei
+            if improved < 0:
+                break
+
+        self.relaxations = relaxations
+        if improved < 0:
+            return []
+        return self._named_cycle(market, improved, predecessors)
+
+    def _named_cycle(self, market, start, predecessors):
+        names = market.currencies
+        named = {names[cid]: (names[pred] if pred >= 0 else None)
+                 for cid, pred in enumerate(predecessors)}
+        on_cycle = self._cycle_in_predecessors(names[start], named)
+        if on_cycle is None:
+            return []
+        return self._reconstruct_cycle(on_cycle, named)
+
+
+def compare_setup(sizes=(50, 200, 1_000), degree=8, calls=20, seed=0):
+    """Seconds per call: dict input rebuilt every call vs a reused MarketGraph"""
+    report = {}
+    for size in sizes:
+        market = random_market(size, degree, seed)
+        row = {}
+
+        engine = SPFACurrencyArbitrage()
+        start = time.perf_counter()
+        for _ in range(calls):
+            engine.find_arbitrage(market)
+        row["dict"] = (time.perf_counter() - start) / calls
+
+        start = time.perf_counter()
+        graph = MarketGraph(market)
+        row["build_once"] = time.perf_counter() - start
+
+        engine = CSRCurrencyArbitrage()
+        start = time.perf_counter()
+        for _ in range(calls):
+            engine.find_arbitrage(graph)
+        row["csr"] = (time.perf_counter() - start) / calls
+
+        pair, rate = next(iter(market.items()))
+        start = time.perf_counter()
+        for _ in range(calls):
+            graph.update_rate(pair, rate)
+        row["update_rate"] = (time.perf_counter() - start) / calls
+        report[size] = row
+    return report
+
+
+class TestMarketGraph:
+
+    def test_csr_layout(self):
+        graph = MarketGraph({('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9,
+                             ('USD', 'GBP'): 0.7})
+        assert graph.currencies == ['USD', 'EUR', 'GBP']
+        assert list(graph.offsets) == [0, 2, 3, 3]
+        assert list(graph.targets) == [1, 2, 2]
+        assert graph.weights[0] == pytest.approx(-math.log(0.8))
+
+    def test_update_in_place_and_new_pair(self):
+        graph = MarketGraph({('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9})
+        targets = graph.targets
+        graph.update_rate(('USD', 'EUR'), 0.5)
+        assert not graph.stale and graph.targets is targets
+        assert graph.weights[0] == pytest.approx(-math.log(0.5))
+
+        graph.update_rate(('GBP', 'USD'), 1.5)
+        assert graph.stale
+        assert CSRCurrencyArbitrage().find_arbitrage(graph) == []
+        graph.update_rate(('USD', 'EUR'), 0.8)
+        assert CSRCurrencyArbitrage().find_arbitrage(graph) == \
+            ['USD', 'EUR', 'GBP', 'USD']
+        with pytest.raises(ValueError):
+            graph.update_rate(('USD', 'EUR'), 0)
+
+    def test_accepts_plain_dict(self):
+        exchange_rates = {('USD', 'EUR'): 0.8, ('EUR', 'JPY'): 130,
+                          ('JPY', 'GBP'): 0.007, ('GBP', 'USD'): 1.4}
+        assert CSRCurrencyArbitrage().find_arbitrage(exchange_rates) == \
+            ['USD', 'EUR', 'JPY', 'GBP', 'USD']
+        assert CSRCurrencyArbitrage().find_arbitrage({}) == []
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_same_cycles_as_dict_engine(self, seed):
+        for plant_cycle in (False, True):
+            market = random_market(80, degree=5, seed=seed, plant_cycle=plant_cycle)
+            engine = CSRCurrencyArbitrage()
+            reference = SPFACurrencyArbitrage()
+            assert engine.find_arbitrage(MarketGraph(market)) == \
+                reference.find_arbitrage(market)
+            assert engine.relaxations == reference.relaxations
+
+    def test_bellman_ford_fallback_uses_virtual_source(self):
+        exchange_rates = {('USD', 'EUR'): 0.9, ('GBP', 'JPY'): 150,
+                          ('JPY', 'GBP'): 0.007}
+        engine = CSRCurrencyArbitrage(budget=0)
+        reference = SPFACurrencyArbitrage(budget=0)
+        assert engine.find_arbitrage(MarketGraph(exchange_rates)) == ['GBP', 'JPY', 'GBP']
+        for plant_cycle in (False, True):
+            market = random_market(40, degree=4, seed=1, plant_cycle=plant_cycle)
+            assert engine.find_arbitrage(market) == reference.find_arbitrage(market)
+            assert engine.relaxations == reference.relaxations
+
+
+if __name__ == "__main__":
+    for size, row in compare_setup().items():
+        print(f"{size:>5} currencies: dict {row['dict'] * 1000:8.2f} ms/call, "
+              f"csr {row['csr'] * 1000:8.2f} ms/call "
+              f"(graph built once in {row['build_once'] * 1000:.2f} ms, "
+              f"update_rate {row['update_rate'] * 1e6:.1f} us)")
@@ -0,0 +1,268 @@
+import heapq
+import itertools
+import math
+import random
+import time
+from collections import defaultdict
+
+import pytest
+
+from test_currency_triangle_arbitrage import CurrencyTriangleArbitrage
+from test_spfa_arbitrage import SPFACurrencyArbitrage
+from test_vectorized_arbitrage import random_market
+
+
+def noisy_market(num_currencies, degree=4, seed=0, spread=(0.99, 1.01)):
+    """Like random_market, but a spread above 1 leaves many small arbitrages"""
+    rng = random.Random(seed)
+    names = [f"C{i}" for i in range(num_currencies)]
+    prices = [math.exp(rng.uniform(-3, 3)) for _ in names]
+    rates = {}
+    for i, name in enumerate(names):
+        for j in rng.sample(range(num_currencies), min(degree + 1, num_currencies)):
+            if j != i:
+                rates[(name, names[j])] = prices[i] / prices[j] * rng.uniform(*spread)
+    return rates
+
+
+class RankedCurrencyArbitrage(CurrencyTriangleArbitrage):
+    """
+    Top-k most profitable simple arbitrage cycles up to a maximum length
+
+    1. Split the graph into strongly connected components (Tarjan); a
+       cycle never leaves its component
+    2. Drop components without any negative cycle (one SPFA check each)
+    3. Johnson-style search in each remaining component: currencies in a
+       fixed order, cycles rooted at their smallest currency only, so
+       each simple cycle is generated exactly once
+
+    Pruning in step 3, for the root s and a path ending at v:
+
+    back[h][v] = lightest walk v → s using at most h edges (hop-limited
+                 Bellman-Ford backwards from s, a lower bound for paths)
+
+    extend the path only while
+        path weight + back[edges left][v] < k-th best cycle weight so far
+
+    so once k good cycles are known, most branches die immediately.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.expanded = 0
+
+    def _components(self, graph):
+        """Strongly connected components, iterative Tarjan"""
+        index, low, on_stack = {}, {}, set()
+        stack, components = [], []
+        for root in graph:
+            if root in index:
+                continue
+            work = [(root, iter(graph[root]))]
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, neighbours = work[-1]
+                for nei in neighbours:
+                    if nei not in index:
+                        index[nei] = low[nei] = len(index)
+                        stack.append(nei)
+                        on_stack.add(nei)
+                        work.append((nei, iter(graph[nei])))
+                        break
+                    if nei in on_stack:
+                        low[node] = min(low[node], index[nei])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def _rotate(self, cycle):
+        """Start at 'USD' if present, else the smallest currency; close the loop"""
+        start = cycle.index('USD') if 'USD' in cycle else cycle.index(min(cycle))
+        cycle = cycle[start:] + cycle[:start]
+        return cycle + [cycle[0]]
+
+    def _back_bounds(self, reverse, allowed, root, hops):
+        back = [{node: math.inf for node in allowed}]
+        back[0][root] = 0.0
+        for _ in range(hops):
+            previous = back[-1]
+            current = dict(previous)
+            for node, best in previous.items():
+                if best == math.inf:
+                    continue
+                for src, weight in reverse[node].items():
+                    if src in allowed and best + weight < current[src]:
+                        current[src] = best + weight
+            back.append(current)
+        return back
+
+    def _search(self, graph, reverse, component, k, max_length, prune, best):
+        order = sorted(component)
+        for position, root in enumerate(order):
+            allowed = set(order[position:])
+            back = self._back_bounds(reverse, allowed, root, max_length) if prune else None
+            path, on_path = [root], {root}
+            # each frame: node, path weight up to node, its remaining edges
+            work = [(root, 0.0, iter(graph[root].items()))]
+            while work:
+                node, path_weight, edges = work[-1]
+                for nei, weight in edges:
+                    if nei not in allowed:
+                        continue
+                    total = path_weight + weight
+                    threshold = -best[0][0] if len(best) == k else 0.0
+                    if nei == root:
+                        if total < threshold:
+                            entry = (-total, self._rotate(path))
+                            if len(best) < k:
+                                heapq.heappush(best, entry)
+                            else:
+                                heapq.heappushpop(best, entry)
+                        continue
+                    if nei in on_path or len(path) >= max_length:
+                        continue
+                    if prune and total + back[max_length - len(path)][nei] >= threshold:
+                        continue
+                    self.expanded += 1
+                    path.append(nei)
+                    on_path.add(nei)
+                    work.append((nei, total, iter(graph[nei].items())))
+                    break
+                else:
+                    work.pop()
+                    on_path.discard(path.pop())
+
+    def find_top_arbitrages(self, exchange_rates, k=5, max_length=4, prune=True):
+        """
+        Returns:
+            Up to k (profit, cycle) pairs, most profitable first, where
+            profit is the product of rates along the cycle (> 1)
+        """
+        if k <= 0 or max_length < 2:
+            return []
+        graph, reverse = defaultdict(dict), defaultdict(dict)
+        for (from_cur, to_cur), rate in exchange_rates.items():
+            if from_cur != to_cur:
+                graph[from_cur][to_cur] = -math.log(rate)
+                reverse[to_cur][from_cur] = -math.log(rate)
+                graph.setdefault(to_cur, {})
+
+        self.expanded = 0
+        best = []  # heap of (-weight, cycle): best[0] is the worst kept
+        detector = SPFACurrencyArbitrage()
+        for component in self._components(graph):
+            if len(component) < 2:
+                continue
+            members = set(component)
+            sub_rates = {pair: rate for pair, rate in exchange_rates.items()
+                         if pair[0] in members and pair[1] in members}
+            if not detector.find_arbitrage(sub_rates):
+                continue
+            self._search(graph, reverse, component, k, max_length, prune, best)
+
+        ranked = sorted(best, key=lambda entry: (entry[0], entry[1]), reverse=True)
+        return [(math.exp(neg_weight), cycle) for neg_weight, cycle in ranked]
+
+
+def compare_pruning(sizes=(50, 100, 200, 400), degree=6, k=10, max_length=5, seed=0):
+    """Seconds and search nodes expanded, with and without bound pruning"""
+    report = {}
+    for size in sizes:
+        market = noisy_market(size, degree, seed)
+        row = {}
+        for prune in (False, True):
+            engine = RankedCurrencyArbitrage()
+            start = time.perf_counter()
+            engine.find_top_arbitrages(market, k, max_length, prune=prune)
+            row["pruned" if prune else "plain"] = {
+                "seconds": time.perf_counter() - start,
+                "expanded": engine.expanded,
+            }
+        report[size] = row
+    return report
+
+
+def brute_force_cycles(exchange_rates, max_length):
+    """Every profitable simple cycle, by trying all currency permutations"""
+    currencies = sorted({cur for pair in exchange_rates for cur in pair})
+    found = {}
+    for length in range(2, max_length + 1):
+        for combo in itertools.permutations(currencies, length):
+            if combo[0] != min(combo):
+                continue
+            pairs = list(zip(combo, combo[1:] + combo[:1]))
+            if all(pair in exchange_rates for pair in pairs):
+                profit = math.prod(exchange_rates[pair] for pair in pairs)
+                if profit > 1:
+                    found[combo] = profit
+    return sorted(found.values(), reverse=True)
+
+
+class TestRankedCurrencyArbitrage:
+
+    def setup_method(self):
+        self.arbitrage = RankedCurrencyArbitrage()
+
+    def test_ranks_two_cycles(self):
+        exchange_rates = {
+            ('USD', 'EUR'): 0.75, ('EUR', 'GBP'): 0.85, ('GBP', 'USD'): 1.6,
+            ('USD', 'JPY'): 110, ('JPY', 'EUR'): 0.008, ('EUR', 'USD'): 1.25,
+        }
+        result = self.arbitrage.find_top_arbitrages(exchange_rates, k=5)
+        cycles = [cycle for _, cycle in result]
+        assert cycles[0] == ['USD', 'JPY', 'EUR', 'GBP', 'USD']
+        assert ['USD', 'EUR', 'GBP', 'USD'] in cycles
+        assert ['USD', 'JPY', 'EUR', 'USD'] in cycles
+        profits = [profit for profit, _ in result]
+        assert profits == sorted(profits, reverse=True)
+        assert profits[0] == pytest.approx(110 * 0.008 * 0.85 * 1.6)
+
+    def test_max_length_limits_cycles(self):
+        exchange_rates = {('USD', 'EUR'): 0.8, ('EUR', 'JPY'): 130,
+                          ('JPY', 'GBP'): 0.007, ('GBP', 'USD'): 1.4}
+        assert self.arbitrage.find_top_arbitrages(exchange_rates, max_length=3) == []
+        [(profit, cycle)] = self.arbitrage.find_top_arbitrages(exchange_rates, max_length=4)
+        assert cycle == ['USD', 'EUR', 'JPY', 'GBP', 'USD']
+
+    def test_no_arbitrage(self):
+        assert self.arbitrage.find_top_arbitrages(random_market(100, seed=2)) == []
+        assert self.arbitrage.find_top_arbitrages({}) == []
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_brute_force(self, seed):
+        market = noisy_market(9, degree=4, seed=seed, spread=(0.97, 1.03))
+        expected = brute_force_cycles(market, 4)[:7]
+        for prune in (True, False):
+            result = self.arbitrage.find_top_arbitrages(market, k=7, max_length=4,
+                                                        prune=prune)
+            assert [profit for profit, _ in result] == pytest.approx(expected)
+
+    def test_pruning_expands_fewer_nodes(self):
+        market = noisy_market(60, degree=5, seed=1)
+        plain = RankedCurrencyArbitrage()
+        plain_result = plain.find_top_arbitrages(market, k=5, max_length=5, prune=False)
+        pruned_result = self.arbitrage.find_top_arbitrages(market, k=5, max_length=5)
+        assert [p for p, _ in pruned_result] == pytest.approx([p for p, _ in plain_result])
+        assert self.arbitrage.expanded < plain.expanded / 5
+
+
+if __name__ == "__main__":
+    for size, row in compare_pruning().items():
+        print(f"{size:>5} currencies: plain {row['plain']['seconds'] * 1000:9.1f} ms "
+              f"({row['plain']['expanded']:>9,} expanded), "
+              f"pruned {row['pruned']['seconds'] * 1000:9.1f} ms "
+              f"({row['pruned']['expanded']:>9,} expanded)")
@@ -0,0 +1,182 @@
+import math
+import time
+from collections import defaultdict, deque
+
+import pytest
+
+from test_currency_triangle_arbitrage import CurrencyTriangleArbitrage
+from test_vectorized_arbitrage import random_market
+
+
+class SPFACurrencyArbitrage(CurrencyTriangleArbitrage):
+    """
+    Queue-driven (SPFA) negative cycle detection
+
+    Instead of V-1 full passes over every edge, only currencies whose
+    distance just dropped are re-examined:
+
+    queue: [all currencies]   (every distance starts at 0: a virtual
+                               source, so cycles anywhere are found)
+      pop u ──► relax u's edges ──► push each improved v not yet queued
+
+    - No arbitrage: the queue drains as soon as distances settle, often
+      after touching each edge only a few times
+    - Arbitrage: a currency relaxed V times sits behind a negative cycle;
+      its predecessor chain is walked into the cycle right away
+    - Worst-case guard: after `budget` relaxations (default V·E, the
+      Bellman-Ford budget) the search hands over to V full Bellman-Ford
+      passes from the same virtual source
+    """
+
+    def __init__(self, budget=None):
+        super().__init__()
+        self.budget = budget
+        self.relaxations = 0
+
+    def _cycle_in_predecessors(self, start, predecessors):
+        """A currency on a predecessor cycle reachable from start, or None"""
+        seen = set()
+        current = start
+        while current is not None and current not in seen:
+            seen.add(current)
+            current = predecessors[current]
+        return current
+
+    def find_arbitrage(self, exchange_rates):
+        graph = defaultdict(list)
+        for (from_cur, to_cur), rate in exchange_rates.items():
+            graph[from_cur].append((to_cur, -math.log(rate)))
+            graph.setdefault(to_cur, [])
+
+        currencies = list(graph)
+        n = len(currencies)
+        distances = {cur: 0.0 for cur in currencies}
+        predecessors = {cur: None for cur in currencies}
+        relax_count = {cur: 0 for cur in currencies}
+        queue = deque(currencies)
+        in_queue = set(currencies)
+        budget = self.budget
+        if budget is None:
+            budget = n * max(1, len(exchange_rates))
+        self.relaxations = 0
+
+        while queue:
+            cur = queue.popleft()
+            in_queue.discard(cur)
+            for nei, weight in graph[cur]:
+                if distances[cur] + weight < distances[nei]:
+                    distances[nei] = distances[cur] + weight
+                    predecessors[nei] = cur
+                    relax_count[nei] += 1
+                    self.relaxations += 1
+
+                    if relax_count[nei] >= n:
+                        on_cycle = self._cycle_in_predecessors(nei, predecessors)
+                        if on_cycle is not None:
+                            return self._reconstruct_cycle(on_cycle, predecessors)
+                    if self.relaxations > budget:
+                        return self._bellman_ford(graph, currencies)
+                    if nei not in in_queue:
+                        queue.append(nei)
+                        in_queue.add(nei)
+        return []
+
+    def _bellman_ford(self, graph, currencies):
+        """
+        Worst-case fallback: V passes over every edge, all distances at 0
+
+        Starting every currency at 0 is the virtual source again, so a
+        cycle is found wherever it is, whichever currency comes first.
+        A currency still improving in pass V sits behind a negative cycle.
+        """
+        distances = {cur: 0.0 for cur in currencies}
+        predecessors = {cur: None for cur in currencies}
+        for _ in range(len(currencies)):
+            improved = None
+            for cur in currencies:
+                for nei, weight in graph[cur]:
+                    if distances[cur] + weight < distances[nei]:
+                        distances[nei] = distances[cur] + weight
+                        predecessors[nei] = cur
+                        self.relaxations += 1
+                        improved = nei
+            if improved is None:
+                return []
+
+        on_cycle = self._cycle_in_predecessors(improved, predecessors)
+        if on_cycle is None:
+            return []
+        return self._reconstruct_cycle(on_cycle, predecessors)
+
+
+def compare_engines(sizes=(10, 50, 100, 200, 400), degree=8, seed=0):
+    """Seconds per call on arbitrage-free markets, Bellman-Ford vs SPFA"""
+    report = {}
+    for size in sizes:
+        market = random_market(size, degree, seed)
+        row = {}
+        for name, engine in [("bellman_ford", CurrencyTriangleArbitrage()),
+                             ("spfa", SPFACurrencyArbitrage())]:
+            start = time.perf_counter()
+            engine.find_arbitrage(market)
+            row[name] = time.perf_counter() - start
+        report[size] = row
+    return report
+
+
+class TestSPFACurrencyArbitrage:
+
+    def setup_method(self):
+        self.arbitrage = SPFACurrencyArbitrage()
+
+    def test_simple_arbitrage_triangle(self):
+        exchange_rates = {('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9,
+                          ('GBP', 'USD'): 1.5}
+        assert self.arbitrage.find_arbitrage(exchange_rates) == \
+            ['USD', 'EUR', 'GBP', 'USD']
+
+    def test_four_currency_arbitrage(self):
+        exchange_rates = {('USD', 'EUR'): 0.8, ('EUR', 'JPY'): 130,
+                          ('JPY', 'GBP'): 0.007, ('GBP', 'USD'): 1.4}
+        assert self.arbitrage.find_arbitrage(exchange_rates) == \
+            ['USD', 'EUR', 'JPY', 'GBP', 'USD']
+
+    def test_no_arbitrage_and_empty_market(self):
+        exchange_rates = {('USD', 'EUR'): 0.85, ('EUR', 'GBP'): 0.90,
+                          ('GBP', 'USD'): 1.30}
+        assert self.arbitrage.find_arbitrage(exchange_rates) == []
+        assert self.arbitrage.find_arbitrage({}) == []
+
+    def test_finds_cycle_unreachable_from_first_currency(self):
+        exchange_rates = {('USD', 'EUR'): 0.9, ('GBP', 'JPY'): 150,
+                          ('JPY', 'GBP'): 0.007}
+        assert self.arbitrage.find_arbitrage(exchange_rates) == \
+            ['GBP', 'JPY', 'GBP']
+
+    def test_settles_early_on_clean_market(self):
+        market = random_market(200, degree=8, seed=1)
+        assert self.arbitrage.find_arbitrage(market) == []
+        assert self.arbitrage.relaxations < len(market) * 199 // 10
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_planted_cycle(self, seed):
+        market = random_market(80, degree=5, seed=seed, plant_cycle=True)
+        assert self.arbitrage.find_arbitrage(market) == ['C0', 'C1', 'C2', 'C0']
+
+    def test_bellman_ford_fallback_uses_virtual_source(self):
+        fallback = SPFACurrencyArbitrage(budget=0)
+        exchange_rates = {('USD', 'EUR'): 0.9, ('GBP', 'JPY'): 150,
+                          ('JPY', 'GBP'): 0.007}
+        reordered = dict(reversed(list(exchange_rates.items())))
+        for market in (exchange_rates, reordered):
+            assert fallback.find_arbitrage(market) == ['GBP', 'JPY', 'GBP']
+        assert fallback.find_arbitrage(random_market(40, degree=4)) == []
+        for seed in range(3):
+            market = random_market(40, degree=4, seed=seed, plant_cycle=True)
+            assert fallback.find_arbitrage(market) == ['C0', 'C1', 'C2', 'C0']
+
+
+if __name__ == "__main__":
+    for size, row in compare_engines().items():
+        print(f"{size:>5} currencies: bellman-ford {row['bellman_ford'] * 1000:9.2f} ms, "
+              f"spfa {row['spfa'] * 1000:9.2f} ms")
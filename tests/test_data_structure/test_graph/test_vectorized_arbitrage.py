@@ -0,0 +1,188 @@
+import math
+import random
+import time
+
+import pytest
+
+from test_currency_triangle_arbitrage import CurrencyTriangleArbitrage
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, only this engine needs it
+    np = None
+
+
+def random_market(num_currencies, degree=4, seed=0, plant_cycle=False):
+    """
+    Seeded synthetic market {(from, to): rate} without arbitrage
+
+    Every currency gets a hidden price p; rate(a → b) = p_a / p_b times a
+    spread < 1, so every cycle loses money. plant_cycle=True overrides
+    three rates to form one profitable triangle C0 → C1 → C2 → C0.
+    """
+    rng = random.Random(seed)
+    names = [f"C{i}" for i in range(num_currencies)]
+    prices = [math.exp(rng.uniform(-3, 3)) for _ in names]
+    rates = {}
+    for i, name in enumerate(names):
+        targets = rng.sample(range(num_currencies), min(degree + 1, num_currencies))
+        for j in targets:
+            if j != i:
+                rates[(name, names[j])] = prices[i] / prices[j] * rng.uniform(0.97, 0.999)
+    if plant_cycle and num_currencies >= 3:
+        a, b, c = names[:3]
+        rates[(a, b)] = prices[0] / prices[1]
+        rates[(b, c)] = prices[1] / prices[2]
+        rates[(c, a)] = prices[2] / prices[0] * 1.01
+    return rates
+
+
+class VectorizedCurrencyArbitrage(CurrencyTriangleArbitrage):
+    """
+    Bellman-Ford with every relaxation pass done as NumPy array operations
+
+    EDGE ARRAYS (sorted by dst once, so each pass is a segmented min):
+    ==================================================================
+
+    src:    [ 2,  0,  1,  0, ... ]
+    dst:    [ 0,  1,  1,  2, ... ]     starts = first edge of each dst
+    weight: [-log(rate), ...]
+
+    one pass:
+      candidate = dist[src] + weight
+      best[d]   = min(candidate over edges into d)   (np.minimum.reduceat)
+      improved  = best < dist
+      pred[d]   = src of an edge achieving best[d], for improved d
+
+    Passes stop early once nothing improves (no negative cycle). When
+    something still improves after V-1 passes, the predecessor chain is
+    walked into the cycle and _reconstruct_cycle formats it exactly as
+    the pure-Python engine does.
+    """
+
+    def __init__(self):
+        super().__init__()
+        if np is None:
+            raise ImportError("VectorizedCurrencyArbitrage requires numpy")
+
+    def _edge_arrays(self, exchange_rates):
+        index = {}
+        for pair in exchange_rates:
+            for currency in pair:
+                index.setdefault(currency, len(index))
+        src = np.fromiter((index[a] for a, _ in exchange_rates), dtype=np.int64,
+                          count=len(exchange_rates))
+        dst = np.fromiter((index[b] for _, b in exchange_rates), dtype=np.int64,
+                          count=len(exchange_rates))
+        rates = np.fromiter(exchange_rates.values(), dtype=np.float64,
+                            count=len(exchange_rates))
+        order = np.argsort(dst, kind="stable")
+        return list(index), src[order], dst[order], -np.log(rates[order])
+
+    def _cycle_node(self, improved, pred, n):
+        """A node reached by walking n predecessors from an improved node"""
+        for start in np.flatnonzero(improved):
+            node = int(start)
+            for _ in range(n):
+                node = int(pred[node])
+                if node < 0:
+                    break
+            else:
+                return int(start)
+        return None
+
+    def find_arbitrage(self, exchange_rates):
+        if not exchange_rates:
+            return []
+        names, src, dst, weight = self._edge_arrays(exchange_rates)
+        n = len(names)
+        targets, starts = np.unique(dst, return_index=True)
+
+        dist = np.full(n, np.inf)
+        dist[0] = 0.0
+        pred = np.full(n, -1, dtype=np.int64)
+        self.relaxations = 0
+
+        # V-1 passes settle every shortest path; keep going (bounded) only
+        # until the predecessor graph has closed a negative cycle
+        for pass_number in range(1, 2 * n + 1):
+            candidate = dist[src] + weight
+            best = np.full(n, np.inf)
+            best[targets] = np.minimum.reduceat(candidate, starts)
+            improved = best < dist
+            if not improved.any():
+                return []
+
+            self.relaxations += int(np.count_nonzero(improved))
+            achieving = improved[dst] & (candidate == best[dst])
+            pred[dst[achieving]] = src[achieving]
+            dist = np.where(improved, best, dist)
+
+            if pass_number >= n:
+                start = self._cycle_node(improved, pred, n)
+                if start is not None:
+                    predecessors = {names[i]: (names[p] if p >= 0 else None)
+                                    for i, p in enumerate(pred.tolist())}
+                    return self._reconstruct_cycle(names[start], predecessors)
+        return []
+
+
+def compare_engines(sizes=(10, 50, 100, 200, 400), degree=8, seed=0):
+    """Seconds per find_arbitrage call, pure Python vs NumPy engine"""
+    report = {}
+    for size in sizes:
+        market = random_market(size, degree, seed)
+        row = {}
+        for name, engine in [("python", CurrencyTriangleArbitrage()),
+                             ("numpy", VectorizedCurrencyArbitrage())]:
+            start = time.perf_counter()
+            engine.find_arbitrage(market)
+            row[name] = time.perf_counter() - start
+        report[size] = row
+    return report
+
+
+class TestVectorizedCurrencyArbitrage:
+
+    def setup_method(self):
+        pytest.importorskip("numpy")
+        self.python_engine = CurrencyTriangleArbitrage()
+        self.numpy_engine = VectorizedCurrencyArbitrage()
+
+    @pytest.mark.parametrize("exchange_rates", [
+        {('USD', 'EUR'): 0.8, ('EUR', 'GBP'): 0.9, ('GBP', 'USD'): 1.5},
+        {('USD', 'EUR'): 0.8, ('EUR', 'JPY'): 130, ('JPY', 'GBP'): 0.007,
+         ('GBP', 'USD'): 1.4},
+        {('USD', 'EUR'): 0.85, ('EUR', 'GBP'): 0.90, ('GBP', 'USD'): 1.30},
+        {},
+    ])
+    def test_same_result_as_python_engine(self, exchange_rates):
+        assert self.numpy_engine.find_arbitrage(exchange_rates) == \
+            self.python_engine.find_arbitrage(exchange_rates)
+
+    def test_multiple_arbitrage_paths(self):
+        exchange_rates = {
+            ('USD', 'EUR'): 0.75, ('EUR', 'GBP'): 0.85, ('GBP', 'USD'): 1.6,
+            ('USD', 'JPY'): 110, ('JPY', 'EUR'): 0.008, ('EUR', 'USD'): 1.25,
+        }
+        result = self.numpy_engine.find_arbitrage(exchange_rates)
+        assert result[0] == result[-1]
+        profit = 1.0
+        for a, b in zip(result, result[1:]):
+            profit *= exchange_rates[(a, b)]
+        assert profit > 1
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_markets_agree(self, seed):
+        clean = random_market(60, degree=5, seed=seed)
+        assert self.numpy_engine.find_arbitrage(clean) == []
+
+        planted = random_market(60, degree=5, seed=seed, plant_cycle=True)
+        assert self.numpy_engine.find_arbitrage(planted) == \
+            self.python_engine.find_arbitrage(planted) == ['C0', 'C1', 'C2', 'C0']
+
+
+if __name__ == "__main__":
+    for size, row in compare_engines().items():
+        print(f"{size:>5} currencies: python {row['python'] * 1000:9.2f} ms, "
+              f"numpy {row['numpy'] * 1000:9.2f} ms")
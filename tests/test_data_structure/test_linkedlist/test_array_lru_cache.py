@@ -0,0 +1,246 @@
+import time
+import tracemalloc
+from array import array
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class ArrayLRUCache:
+    """
+    LRU Cache backed by preallocated parallel integer arrays
+
+    Same get/put contract as LRUCache, but the recency list lives in
+    slot-indexed arrays instead of one ListNode object per entry.
+
+    SLOT LAYOUT (capacity = 3):
+    ===========================
+
+    slot:    0 (dummy)   1      2      3
+    prev:  [ 2,          0,     1,     0 ]
+    next:  [ 1,          2,     0,     0 ]
+    keys:  [ None,       k1,    k2,    None ]
+    vals:  [ None,       v1,    v2,    None ]
+
+    - Slot 0 is the dummy node: next[0] is the MRU slot, prev[0] the LRU slot
+    - cache maps key -> slot, so lookups stay O(1)
+    - Free slots are chained through next[], starting at free_head
+
+    WHY:
+    - No per-entry object, no per-entry __dict__, nothing for the GC to track
+    - prev/next cost 4 bytes per slot each ('i' typecode)
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        self.capacity = capacity
+        self.cache = {}
+        size = capacity + 1
+        self.prev = array('i', [0]) * size
+        self.next = array('i', range(1, size + 1))
+        self.keys = [None] * size
+        self.vals = [None] * size
+
+        # Dummy slot 0 points at itself; slots 1..capacity form the free list
+        self.next[0] = 0
+        self.next[capacity] = 0
+        self.free_head = 1
+
+    @classmethod
+    def from_entries(cls, capacity: int, keys, vals) -> "ArrayLRUCache":
+        """
+        Cache holding keys/vals (MRU first) in slots 1..n, the rest free
+
+        slot:  0    1    2   ...  n    n+1  ...  capacity
+        prev:  n    0    1   ...  n-1
+        next:  1    2    3   ...  0    n+2  ...  0
+
+        The arrays are built once in this final layout; going through
+        __init__ would first allocate and fill an empty free list.
+        """
+        n = len(keys)
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        if n > capacity:
+            raise ValueError("More entries than capacity")
+        cache = cls.__new__(cls)
+        cache.capacity = capacity
+        cache.cache = dict(zip(keys, range(1, n + 1)))
+
+        # prev[slot] = slot - 1 and next[slot] = slot + 1 are two slices
+        # of one sequence, converted from Python ints only once
+        sequence = array('i', range(-1, capacity + 2))
+        cache.prev = sequence[:capacity + 1]
+        cache.next = sequence[2:]
+        cache.prev[0] = n
+        cache.next[n] = 0
+        cache.next[capacity] = 0
+
+        padding = [None] * (capacity - n)
+        cache.keys = [None, *keys, *padding]
+        cache.vals = [None, *vals, *padding]
+        cache.free_head = n + 1
+        return cache
+
+    def _allocate_slot(self) -> int:
+        """Pop a slot off the free list"""
+        slot = self.free_head
+        self.free_head = self.next[slot]
+        return slot
+
+    def _release_slot(self, slot: int) -> None:
+        """Push a slot back onto the free list"""
+        self.keys[slot] = None
+        self.vals[slot] = None
+        self.next[slot] = self.free_head
+        self.free_head = slot
+
+    def _add_to_head(self, slot: int) -> None:
+        """Link slot right after dummy slot 0"""
+        current_first = self.next[0]
+        self.prev[slot] = 0
+        self.next[slot] = current_first
+        self.prev[current_first] = slot
+        self.next[0] = slot
+
+    def _remove_node(self, slot: int) -> None:
+        """Unlink slot by connecting its neighbours directly"""
+        prev_slot = self.prev[slot]
+        next_slot = self.next[slot]
+        self.next[prev_slot] = next_slot
+        self.prev[next_slot] = prev_slot
+
+    def _move_to_head(self, slot: int) -> None:
+        self._remove_node(slot)
+        self._add_to_head(slot)
+
+    def _remove_tail(self) -> int:
+        """Unlink and return the LRU slot (the one before dummy slot 0)"""
+        lru_slot = self.prev[0]
+        self._remove_node(lru_slot)
+        return lru_slot
+
+    def get(self, key: int) -> int:
+        if key in self.cache:
+            slot = self.cache[key]
+            self._move_to_head(slot)
+            return self.vals[slot]
+
+        return -1
+
+    def put(self, key: int, value: int) -> None:
+        if key in self.cache:
+            slot = self.cache[key]
+            self.vals[slot] = value
+            self._move_to_head(slot)
+
+        else:
+            if len(self.cache) >= self.capacity:
+                lru_slot = self._remove_tail()
+                del self.cache[self.keys[lru_slot]]
+                self._release_slot(lru_slot)
+
+            slot = self._allocate_slot()
+            self.keys[slot] = key
+            self.vals[slot] = value
+            self.cache[key] = slot
+            self._add_to_head(slot)
+
+
+def measure_memory(cache_class, n):
+    """Bytes allocated while filling a cache of capacity n with n entries"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    cache = cache_class(n)
+    for i in range(n):
+        cache.put(i, i)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def measure_throughput(cache_class, capacity, ops):
+    """Mixed get/put operations per second over a key space 2x capacity"""
+    cache = cache_class(capacity)
+    key_space = capacity * 2
+    start = time.perf_counter()
+    for i in range(ops):
+        key = (i * 7919) % key_space
+        if cache.get(key) == -1:
+            cache.put(key, i)
+    elapsed = time.perf_counter() - start
+    return ops / elapsed
+
+
+def compare_storage(n=100_000, ops=500_000):
+    """Memory (bytes/entry) and throughput (ops/s) of node vs array storage"""
+    report = {}
+    for name, cache_class in [("node", LRUCache), ("array", ArrayLRUCache)]:
+        report[name] = {
+            "bytes_per_entry": measure_memory(cache_class, n) / n,
+            "ops_per_sec": measure_throughput(cache_class, n, ops),
+        }
+    return report
+
+
+class TestArrayLRUCache:
+
+    def test_capacity_validation(self):
+        with pytest.raises(ValueError):
+            ArrayLRUCache(0)
+
+    def test_leetcode_example_1(self):
+        """Same sequence as LeetCode 146 example 1"""
+        cache = ArrayLRUCache(2)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        assert cache.get(1) == 1
+        cache.put(3, 3)
+        assert cache.get(2) == -1
+        cache.put(4, 4)
+        assert cache.get(1) == -1
+        assert cache.get(3) == 3
+        assert cache.get(4) == 4
+
+    def test_update_existing_key_moves_to_head(self):
+        cache = ArrayLRUCache(2)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.put(1, 10)
+        cache.put(3, 3)
+        assert cache.get(1) == 10
+        assert cache.get(2) == -1
+
+    def test_slots_are_recycled(self):
+        """Evicted slots go back to the free list instead of growing arrays"""
+        cache = ArrayLRUCache(3)
+        for i in range(100):
+            cache.put(i, i)
+        assert len(cache.cache) == 3
+        assert len(cache.keys) == 4
+        assert sorted(cache.cache) == [97, 98, 99]
+        assert set(cache.cache.values()) == {1, 2, 3}
+
+    def test_matches_node_based_cache(self):
+        """Random workload gives identical results to LRUCache"""
+        node_cache = LRUCache(16)
+        array_cache = ArrayLRUCache(16)
+        for i in range(2000):
+            key = (i * 31 + i // 7) % 40
+            if i % 3:
+                assert array_cache.get(key) == node_cache.get(key)
+            else:
+                node_cache.put(key, i)
+                array_cache.put(key, i)
+        assert array_cache.cache.keys() == node_cache.cache.keys()
+
+    def test_array_storage_uses_less_memory(self):
+        assert measure_memory(ArrayLRUCache, 5000) < measure_memory(LRUCache, 5000)
+
+
+if __name__ == "__main__":
+    for name, stats in compare_storage().items():
+        print(f"{name:>5}: {stats['bytes_per_entry']:8.1f} bytes/entry, "
+              f"{stats['ops_per_sec']:>12,.0f} ops/s")
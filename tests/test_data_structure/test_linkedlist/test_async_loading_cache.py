@@ -0,0 +1,168 @@
+import asyncio
+import time
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class AsyncLoadingCache:
+    """
+    LRU Cache with single-flight async loading
+
+    100 coroutines miss on the same key at once:
+
+    caller 1 ──┐
+    caller 2 ──┼──► inflight[key] = one Task(loader(key)) ──► cache.put
+      ...      │                │
+    caller N ──┘    all await the same Task (through asyncio.shield)
+
+    - The loader runs once per missing key, not once per caller
+    - Cancelling one caller does not cancel the shared load
+    - cancel(key) cancels the load itself; every waiter gets CancelledError
+    - A loader exception reaches every waiter and nothing is cached
+    """
+
+    def __init__(self, capacity: int):
+        self.cache = LRUCache(capacity)
+        self.inflight = {}
+
+    async def _load(self, key, loader):
+        value = await loader(key)
+        self.cache.put(key, value)
+        return value
+
+    async def get_or_load(self, key, loader):
+        """Cached value for key, loading it (once) on a miss"""
+        if key in self.cache.cache:
+            return self.cache.get(key)
+
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+            self.inflight[key] = task
+        return await asyncio.shield(task)
+
+    def cancel(self, key) -> bool:
+        """Cancel the in-flight load for key, if any"""
+        task = self.inflight.get(key)
+        if task is None:
+            return False
+        return task.cancel()
+
+
+class NaiveAsyncCache:
+    """Baseline: every concurrent miss runs its own loader"""
+
+    def __init__(self, capacity: int):
+        self.cache = LRUCache(capacity)
+
+    async def get_or_load(self, key, loader):
+        if key in self.cache.cache:
+            return self.cache.get(key)
+        value = await loader(key)
+        self.cache.put(key, value)
+        return value
+
+
+class SlowLoader:
+    """Simulated backend: sleeps `delay` seconds, counts calls"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, key):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return key * 10
+
+
+async def _stampede(cache, loader, num_callers, num_keys):
+    keys = [i % num_keys for i in range(num_callers)]
+    return await asyncio.gather(*(cache.get_or_load(key, loader) for key in keys))
+
+
+def compare_stampede(num_callers=1_000, num_keys=10, delay=0.05):
+    """Loader calls and wall time when num_callers miss at once"""
+    report = {}
+    for name, cache_class in [("naive", NaiveAsyncCache),
+                              ("single_flight", AsyncLoadingCache)]:
+        loader = SlowLoader(delay)
+        start = time.perf_counter()
+        asyncio.run(_stampede(cache_class(num_keys), loader, num_callers, num_keys))
+        report[name] = {"loader_calls": loader.calls,
+                        "seconds": time.perf_counter() - start}
+    return report
+
+
+class TestAsyncLoadingCache:
+
+    def test_concurrent_misses_share_one_load(self):
+        loader = SlowLoader()
+        cache = AsyncLoadingCache(4)
+        results = asyncio.run(_stampede(cache, loader, 100, 2))
+        assert results == [(i % 2) * 10 for i in range(100)]
+        assert loader.calls == 2
+        assert cache.inflight == {}
+
+    def test_hit_does_not_call_loader(self):
+        async def scenario():
+            loader = SlowLoader(0)
+            cache = AsyncLoadingCache(4)
+            await cache.get_or_load(1, loader)
+            await cache.get_or_load(1, loader)
+            return loader.calls
+
+        assert asyncio.run(scenario()) == 1
+
+    def test_error_reaches_every_waiter_and_is_not_cached(self):
+        async def failing(key):
+            await asyncio.sleep(0.01)
+            raise KeyError(key)
+
+        async def scenario():
+            cache = AsyncLoadingCache(4)
+            results = await asyncio.gather(
+                *(cache.get_or_load(7, failing) for _ in range(3)),
+                return_exceptions=True)
+            return cache, results
+
+        cache, results = asyncio.run(scenario())
+        assert all(isinstance(result, KeyError) for result in results)
+        assert 7 not in cache.cache.cache
+        assert cache.inflight == {}
+
+    def test_cancelling_one_caller_keeps_load_running(self):
+        async def scenario():
+            loader = SlowLoader(0.02)
+            cache = AsyncLoadingCache(4)
+            first = asyncio.ensure_future(cache.get_or_load(1, loader))
+            second = asyncio.ensure_future(cache.get_or_load(1, loader))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first.cancelled(), loader.calls
+
+        assert asyncio.run(scenario()) == (10, True, 1)
+
+    def test_cancel_load_cancels_all_waiters(self):
+        async def scenario():
+            cache = AsyncLoadingCache(4)
+            waiters = [asyncio.ensure_future(cache.get_or_load(1, SlowLoader(1)))
+                       for _ in range(3)]
+            await asyncio.sleep(0)
+            assert cache.cancel(1)
+            results = await asyncio.gather(*waiters, return_exceptions=True)
+            return cache, results
+
+        cache, results = asyncio.run(scenario())
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+        assert cache.inflight == {}
+        assert not cache.cancel(1)
+
+
+if __name__ == "__main__":
+    for name, stats in compare_stampede().items():
+        print(f"{name:>13}: {stats['loader_calls']:>5} loader calls, "
+              f"{stats['seconds']:.3f} s")
@@ -0,0 +1,219 @@
+import bisect
+import itertools
+import random
+import re
+import time
+import tracemalloc
+
+import pytest
+
+from test_lru_cache import LRUCache
+from test_tinylfu_lru_cache import zipf_keys
+
+
+# Trace sources -------------------------------------------------------------
+
+_INT_KEY = re.compile(r"-?[0-9]+")
+
+
+def read_trace(path):
+    """One key per line; integer keys are parsed as int, others kept as str"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            token = line.strip()
+            if token:
+                yield int(token) if _INT_KEY.fullmatch(token) else token
+
+
+def zipf_trace(length, num_keys=10_000, alpha=1.0, seed=0):
+    rng = random.Random(seed)
+    return list(itertools.islice(zipf_keys(num_keys, alpha, rng), length))
+
+
+def looping_scan_trace(length, loop_size):
+    """0, 1, ..., loop_size-1, 0, 1, ... (LRU's worst case when too small)"""
+    return [i % loop_size for i in range(length)]
+
+
+def sliding_hot_set_trace(length, hot_size=100, shift_every=1_000,
+                          shift_by=10, seed=0):
+    """Uniform accesses over a hot window that slides forward over time"""
+    rng = random.Random(seed)
+    return [(i // shift_every) * shift_by + rng.randrange(hot_size)
+            for i in range(length)]
+
+
+# Replay --------------------------------------------------------------------
+
+def _run(cache, trace):
+    hits = 0
+    for key in trace:
+        if cache.get(key) != -1:
+            hits += 1
+        else:
+            # not the key itself: key -1 would read back as a miss
+            cache.put(key, True)
+    return hits
+
+
+def replay(cache_factory, trace, capacity):
+    """
+    Hit ratio, ops/s and peak traced memory of a get-or-put replay
+
+    Throughput and memory come from two separate runs, because
+    tracemalloc slows every allocation down.
+    """
+    start = time.perf_counter()
+    hits = _run(cache_factory(capacity), trace)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    _run(cache_factory(capacity), trace)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "hit_ratio": hits / len(trace),
+        "ops_per_sec": len(trace) / elapsed,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def simulate(trace, capacities, cache_factory=LRUCache):
+    """One full replay per capacity point (works for any cache policy)"""
+    trace = list(trace)
+    return {capacity: replay(cache_factory, trace, capacity)
+            for capacity in capacities}
+
+
+# Miss-ratio curve in one pass ------------------------------------------------
+
+class FenwickTree:
+    """Prefix sums over positions 1..n with O(log n) update and query"""
+
+    def __init__(self, n: int):
+        self.tree = [0] * (n + 1)
+
+    def add(self, position: int, delta: int) -> None:
+        while position < len(self.tree):
+            self.tree[position] += delta
+            position += position & -position
+
+    def prefix_sum(self, position: int) -> int:
+        total = 0
+        while position > 0:
+            total += self.tree[position]
+            position -= position & -position
+        return total
+
+
+def stack_distances(trace):
+    """
+    LRU stack distance of every access (0 = first access, a cold miss)
+
+    Mattson's observation: an LRU cache of capacity c hits exactly when
+    the stack distance d (distinct keys touched since the previous access
+    to this key, itself included) satisfies d <= c.
+
+    time:   1  2  3  4  5
+    trace:  a  b  c  b  a
+    marks:  1  0  1  1  .     (1 = most recent access of some key)
+    a at 5: last seen at 1, marks in (1, 5) = 2  →  d = 3
+
+    Counting marks with a Fenwick tree makes each access O(log n).
+    """
+    trace = list(trace)
+    marks = FenwickTree(len(trace))
+    last_seen = {}
+    distances = []
+    for time_step, key in enumerate(trace, start=1):
+        previous = last_seen.get(key)
+        if previous is None:
+            distances.append(0)
+        else:
+            between = marks.prefix_sum(time_step - 1) - marks.prefix_sum(previous)
+            distances.append(between + 1)
+            marks.add(previous, -1)
+        marks.add(time_step, 1)
+        last_seen[key] = time_step
+    return distances
+
+
+def miss_ratio_curve(trace, capacities):
+    """LRU miss ratio at every capacity from a single pass over the trace"""
+    distances = stack_distances(trace)
+    if not distances:
+        return {capacity: 0.0 for capacity in capacities}
+    reuse = sorted(distance for distance in distances if distance)
+
+    curve = {}
+    for capacity in capacities:
+        hits = bisect.bisect_right(reuse, capacity)
+        curve[capacity] = 1 - hits / len(distances)
+    return curve
+
+
+TRACES = {
+    "zipf": lambda length: zipf_trace(length),
+    "loop": lambda length: looping_scan_trace(length, 1_000),
+    "sliding": lambda length: sliding_hot_set_trace(length),
+}
+
+
+def report_all(length=100_000, capacities=(50, 100, 250, 500, 1_000, 2_000)):
+    """Miss-ratio curve (one pass) plus full replays per built-in trace"""
+    report = {}
+    for name, make_trace in TRACES.items():
+        trace = make_trace(length)
+        report[name] = {
+            "mrc": miss_ratio_curve(trace, capacities),
+            "replay": simulate(trace, capacities),
+        }
+    return report
+
+
+class TestCacheSimulator:
+
+    def test_stack_distances(self):
+        assert stack_distances("abcba") == [0, 0, 0, 2, 3]
+        assert stack_distances("aaa") == [0, 1, 1]
+
+    @pytest.mark.parametrize("make_trace", [
+        lambda: zipf_trace(3_000, num_keys=500),
+        lambda: looping_scan_trace(2_000, 60),
+        lambda: sliding_hot_set_trace(3_000, hot_size=40, shift_every=200),
+        lambda: [-1, -1, -1, -1, 2, 2],
+    ])
+    def test_mrc_matches_full_replay(self, make_trace):
+        trace = make_trace()
+        capacities = [1, 5, 20, 59, 60, 100]
+        curve = miss_ratio_curve(trace, capacities)
+        replays = simulate(trace, capacities)
+        for capacity in capacities:
+            assert curve[capacity] == pytest.approx(
+                1 - replays[capacity]["hit_ratio"])
+
+    def test_looping_scan_is_all_misses_when_too_small(self):
+        curve = miss_ratio_curve(looping_scan_trace(1_000, 100), [99, 100])
+        assert curve[99] == 1.0
+        assert curve[100] == pytest.approx(0.1)
+
+    def test_read_trace(self, tmp_path):
+        path = tmp_path / "trace.txt"
+        path.write_text("1\n2\n\nuser:7\n-3\n--3\n²\n٣\n+4\n", encoding="utf-8")
+        assert list(read_trace(path)) == [1, 2, "user:7", -3, "--3", "²", "٣", "+4"]
+
+    def test_replay_reports_metrics(self):
+        stats = replay(LRUCache, looping_scan_trace(100, 5), 10)
+        assert stats["hit_ratio"] == pytest.approx(0.95)
+        assert stats["ops_per_sec"] > 0
+        assert stats["peak_bytes"] > 0
+
+
+if __name__ == "__main__":
+    for name, result in report_all().items():
+        print(f"\n{name}")
+        for capacity, miss_ratio in result["mrc"].items():
+            stats = result["replay"][capacity]
+            print(f"  capacity {capacity:>5}: miss ratio {miss_ratio:.3f}, "
+                  f"{stats['ops_per_sec']:>10,.0f} ops/s, "
+                  f"peak {stats['peak_bytes']:>10,} bytes")
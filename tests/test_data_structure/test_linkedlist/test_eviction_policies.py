@@ -0,0 +1,372 @@
+import time
+from collections import OrderedDict
+
+import pytest
+
+from test_lru_cache import LRUCache
+from test_tinylfu_lru_cache import hit_ratio, zipf_with_scans
+
+
+def _pop_key(lru: LRUCache, key: int):
+    """Unlink key from an LRUCache and return its node"""
+    node = lru.cache.pop(key)
+    lru._remove_node(node)
+    return node
+
+
+def _pop_lru(lru: LRUCache):
+    """Unlink the LRU entry of an LRUCache and return its node"""
+    node = lru._remove_tail()
+    del lru.cache[node.key]
+    return node
+
+
+class ClockCache:
+    """
+    CLOCK (second chance) approximation of LRU
+
+    Entries sit in fixed slots on a circle with one reference bit each:
+
+            ┌──► slot 0 (ref 1) ──► slot 1 (ref 0) ──┐
+            │                                        │
+          hand                                       ▼
+            │                                        │
+            └─── slot 3 (ref 1) ◄── slot 2 (ref 1) ◄─┘
+
+    - get() hit: set the slot's ref bit. No list splicing at all
+    - Eviction: sweep the hand, clearing ref bits, until a slot with
+      ref 0 is found; that slot is reused for the new entry
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        self.capacity = capacity
+        self.cache = {}
+        self.keys = [None] * capacity
+        self.vals = [None] * capacity
+        self.ref = bytearray(capacity)
+        self.hand = 0
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def _evict(self) -> int:
+        """Advance the hand to a slot without second chance, free it"""
+        while self.ref[self.hand]:
+            self.ref[self.hand] = 0
+            self.hand = (self.hand + 1) % self.capacity
+        slot = self.hand
+        self.hand = (self.hand + 1) % self.capacity
+        del self.cache[self.keys[slot]]
+        return slot
+
+    def get(self, key: int) -> int:
+        slot = self.cache.get(key)
+        if slot is None:
+            return -1
+        self.ref[slot] = 1
+        return self.vals[slot]
+
+    def put(self, key: int, value: int) -> None:
+        slot = self.cache.get(key)
+        if slot is not None:
+            self.vals[slot] = value
+            self.ref[slot] = 1
+            return
+
+        if len(self.cache) < self.capacity:
+            slot = len(self.cache)
+        else:
+            slot = self._evict()
+        self.keys[slot] = key
+        self.vals[slot] = value
+        self.ref[slot] = 0
+        self.cache[key] = slot
+
+
+class SegmentedLRUCache:
+    """
+    Segmented LRU: a probation segment and a protected segment
+
+    new key ──► probation ──hit──► protected (at most protected_ratio)
+                    ▲                  │
+                    └──── demoted ◄────┘  (protected overflow)
+
+    Eviction always takes the probation tail first, so keys seen only
+    once cannot push out keys that were hit at least twice.
+    """
+
+    def __init__(self, capacity: int, protected_ratio: float = 0.8):
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        self.capacity = capacity
+        self.protected_capacity = max(1, int(capacity * protected_ratio))
+        self.probation = LRUCache(capacity)
+        self.protected = LRUCache(capacity)
+
+    def __len__(self) -> int:
+        return len(self.probation) + len(self.protected)
+
+    def _promote(self, key: int):
+        node = _pop_key(self.probation, key)
+        self.protected.put(node.key, node.val)
+        if len(self.protected) > self.protected_capacity:
+            demoted = _pop_lru(self.protected)
+            self.probation.put(demoted.key, demoted.val)
+        return node
+
+    def get(self, key: int) -> int:
+        if key in self.protected.cache:
+            return self.protected.get(key)
+        if key in self.probation.cache:
+            return self._promote(key).val
+        return -1
+
+    def put(self, key: int, value: int) -> None:
+        if key in self.protected.cache:
+            self.protected.put(key, value)
+            return
+        if key in self.probation.cache:
+            self.probation.cache[key].val = value
+            self._promote(key)
+            return
+
+        if len(self) >= self.capacity:
+            _pop_lru(self.probation if len(self.probation) else self.protected)
+        self.probation.put(key, value)
+
+
+class TwoQueueCache:
+    """
+    Full 2Q: A1in (FIFO of new keys), A1out (ghost keys), Am (LRU)
+
+    new key ──► A1in ──FIFO out──► A1out (keys only)
+                                     │
+                        seen again ──┴──► Am (hot LRU)
+
+    - A1in hits do not reorder anything (FIFO)
+    - Only keys re-requested after leaving A1in reach Am
+    """
+
+    def __init__(self, capacity: int, in_ratio: float = 0.25,
+                 out_ratio: float = 0.5):
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        self.capacity = capacity
+        self.in_capacity = max(1, int(capacity * in_ratio))
+        self.out_capacity = max(1, int(capacity * out_ratio))
+        self.a1_in = LRUCache(capacity)
+        self.a1_out = OrderedDict()
+        self.am = LRUCache(capacity)
+
+    def __len__(self) -> int:
+        return len(self.a1_in) + len(self.am)
+
+    def _reclaim(self) -> None:
+        """Free one resident slot if the cache is full"""
+        if len(self) < self.capacity:
+            return
+        if len(self.a1_in) > self.in_capacity or not len(self.am):
+            node = _pop_lru(self.a1_in)
+            self.a1_out[node.key] = None
+            if len(self.a1_out) > self.out_capacity:
+                self.a1_out.popitem(last=False)
+        else:
+            _pop_lru(self.am)
+
+    def get(self, key: int) -> int:
+        if key in self.am.cache:
+            return self.am.get(key)
+        if key in self.a1_in.cache:
+            return self.a1_in.cache[key].val
+        return -1
+
+    def put(self, key: int, value: int) -> None:
+        if key in self.am.cache:
+            self.am.put(key, value)
+        elif key in self.a1_in.cache:
+            self.a1_in.cache[key].val = value
+        elif key in self.a1_out:
+            del self.a1_out[key]
+            self._reclaim()
+            self.am.put(key, value)
+        else:
+            self._reclaim()
+            self.a1_in.put(key, value)
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache
+
+    Resident:  T1 (seen once, LRU)      T2 (seen twice or more, LRU)
+    Ghosts:    B1 (evicted from T1)     B2 (evicted from T2)
+
+    A miss that hits ghost B1 means T1 was too small, so the target
+    size p of T1 grows; a B2 ghost hit shrinks it. replace() evicts from
+    T1 or T2 depending on p, so the split adapts to the workload.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        self.capacity = capacity
+        self.p = 0.0
+        self.t1 = LRUCache(capacity)
+        self.t2 = LRUCache(capacity)
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.t1) + len(self.t2)
+
+    def _replace(self, key: int) -> None:
+        if len(self) < self.capacity:
+            return
+        t1_size = len(self.t1)
+        if t1_size and (t1_size > self.p or (key in self.b2 and t1_size == self.p)):
+            self.b1[_pop_lru(self.t1).key] = None
+        else:
+            self.b2[_pop_lru(self.t2).key] = None
+
+    def get(self, key: int) -> int:
+        if key in self.t1.cache:
+            node = _pop_key(self.t1, key)
+            self.t2.put(key, node.val)
+            return node.val
+        if key in self.t2.cache:
+            return self.t2.get(key)
+        return -1
+
+    def put(self, key: int, value: int) -> None:
+        if key in self.t1.cache or key in self.t2.cache:
+            self.get(key)
+            self.t2.cache[key].val = value
+            return
+
+        capacity = self.capacity
+        if key in self.b1:
+            self.p = min(capacity, self.p + max(len(self.b2) / len(self.b1), 1))
+            self._replace(key)
+            del self.b1[key]
+            self.t2.put(key, value)
+            return
+        if key in self.b2:
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1))
+            self._replace(key)
+            del self.b2[key]
+            self.t2.put(key, value)
+            return
+
+        l1 = len(self.t1) + len(self.b1)
+        total = l1 + len(self.t2) + len(self.b2)
+        if l1 >= capacity:
+            if len(self.t1) < capacity:
+                self.b1.popitem(last=False)
+                self._replace(key)
+            else:
+                _pop_lru(self.t1)
+        elif total >= capacity:
+            if total >= 2 * capacity:
+                self.b2.popitem(last=False)
+            self._replace(key)
+        self.t1.put(key, value)
+
+
+POLICIES = {
+    "lru": LRUCache,
+    "clock": ClockCache,
+    "slru": SegmentedLRUCache,
+    "2q": TwoQueueCache,
+    "arc": ARCCache,
+}
+
+
+def make_cache(capacity: int, policy: str = "lru"):
+    """Build a cache with the shared get/put interface for a policy name"""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown eviction policy: {policy}")
+    return POLICIES[policy](capacity)
+
+
+def compare_policies(capacity=500, length=200_000):
+    """Hit ratio and ops/s per policy on the Zipf-plus-scan trace"""
+    trace = zipf_with_scans(length)
+    report = {}
+    for policy in POLICIES:
+        cache = make_cache(capacity, policy)
+        start = time.perf_counter()
+        ratio = hit_ratio(cache, trace)
+        elapsed = time.perf_counter() - start
+        report[policy] = {"hit_ratio": ratio, "ops_per_sec": length / elapsed}
+    return report
+
+
+class TestEvictionPolicies:
+
+    @pytest.mark.parametrize("policy", sorted(POLICIES))
+    def test_basic_put_get(self, policy):
+        cache = make_cache(2, policy)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        assert cache.get(1) == 1
+        cache.put(1, 10)
+        assert cache.get(1) == 10
+        assert cache.get(3) == -1
+
+    @pytest.mark.parametrize("policy", sorted(POLICIES))
+    def test_never_exceeds_capacity(self, policy):
+        cache = make_cache(8, policy)
+        for i in range(2000):
+            key = (i * 37) % 50
+            if cache.get(key) == -1:
+                cache.put(key, i)
+            assert len(cache) <= 8
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            make_cache(4, "mru")
+
+    def test_clock_gives_second_chance(self):
+        cache = ClockCache(3)
+        for key in (1, 2, 3):
+            cache.put(key, key)
+        cache.get(1)
+        cache.put(4, 4)
+        assert cache.get(1) == 1
+        assert cache.get(2) == -1
+        assert cache.ref[cache.cache[1]] == 1
+
+    def test_slru_protects_keys_hit_twice(self):
+        cache = SegmentedLRUCache(4, protected_ratio=0.5)
+        cache.put(1, 1)
+        cache.get(1)
+        for key in range(100, 110):
+            cache.put(key, key)
+        assert cache.get(1) == 1
+
+    def test_2q_ghost_hit_goes_to_am(self):
+        cache = TwoQueueCache(4)
+        for key in range(6):
+            cache.put(key, key)
+        assert 0 in cache.a1_out
+        cache.put(0, 0)
+        assert 0 in cache.am.cache
+
+    def test_arc_adapts_on_ghost_hit(self):
+        cache = ARCCache(2)
+        cache.put(1, 1)
+        cache.get(1)
+        cache.put(2, 2)
+        cache.put(3, 3)
+        assert 2 in cache.b1
+        cache.put(2, 2)
+        assert cache.p > 0
+        assert 2 in cache.t2.cache
+
+
+if __name__ == "__main__":
+    for policy, stats in compare_policies().items():
+        print(f"{policy:>5}: hit ratio {stats['hit_ratio']:.3f}, "
+              f"{stats['ops_per_sec']:>10,.0f} ops/s")
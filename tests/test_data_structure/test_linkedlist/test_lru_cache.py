@@ -1,8 +1,11 @@
+import time
 import pytest
-from typing import Optional
+from typing import List, Optional
 
 class ListNode:
     """Doubly Linked List Node for LRU Cache"""
+    __slots__ = ("key", "val", "prev", "next")
+
     def __init__(self, key: int = 0, val: int = 0):
         self.key = key
         self.val = val
@@ -245,7 +248,7 @@ class LRUCache:
         TODO: Implement node removal
         """
         node.prev.next = node.next
-        node.next.prve = node.prev
+        node.next.prev = node.prev
         # TDD HINT: For test_single_put_get to pass, this method needs to:
         # 1. Bypass the node by connecting its neighbors directly
         # 2. This is used when evicting LRU items or moving nodes
@@ -300,7 +303,8 @@ class LRUCache:
         # self._add_to_head(node)
         
         # NOTE: This method is used when accessing existing keys in get() and put()
-        pass
+        self._remove_node(node)
+        self._add_to_head(node)
 
     def _remove_tail(self) -> ListNode:
         """
@@ -341,12 +345,12 @@ class LRUCache:
         TODO: Implement get operation
         """
 
-        if key in self.cache:
-            node = self.cache[key]
+        node = self._lookup(key)
+        if node is not None:
             self._move_to_head(node)
             return node.val
         
-        return -1
+        return self._miss(key)
         
 
     def put(self, key: int, value: int) -> None:
@@ -366,13 +370,27 @@ class LRUCache:
         
         # HINT: Check if key already exists in cache
         # if key in self.cache:
+        self._store(key, value)
+
+    # Hooks shared by the single and bulk paths; subclasses override these
+    # (not get/put) so that get_many/put_many follow the same rules.
+    def _lookup(self, key: int) -> Optional[ListNode]:
+        """Node for key, or None on a miss"""
+        return self.cache.get(key)
+
+    def _miss(self, key: int) -> int:
+        """Value reported for a key that is not cached"""
+        return -1
+
+    def _store(self, key: int, value: int) -> None:
+        """Insert or update one entry, evicting the LRU entry when full"""
         if key in self.cache:
             node = self.cache[key]
             node.val = value
             self._move_to_head(node)
 
         else:
-            if len(self.cache) > self.capacity:
+            if len(self.cache) >= self.capacity:
                 lru_node = self._remove_tail()
                 del self.cache[lru_node.key]
             
@@ -380,6 +398,75 @@ class LRUCache:
             self.cache[key] = new_node
             self._add_to_head(new_node)
 
+    def get_many(self, keys) -> List[int]:
+        """
+        Get several keys at once, same result as calling get() per key
+
+        BATCHED RECENCY UPDATE:
+        Only the order of *last* accesses decides the final LRU order, so
+        each distinct hit key is moved to head exactly once:
+
+        keys:        [a, b, a, c]
+        last access:        b, a, c    → moves: b, a, c
+        final list:  HEAD ◄──► c ◄──► a ◄──► b ◄──► ...
+        """
+        keys = list(keys)
+        cache = self.cache
+        results = []
+        for key in keys:
+            node = self._lookup(key)
+            results.append(node.val if node is not None else self._miss(key))
+
+        most_recent_first = dict.fromkeys(key for key in reversed(keys) if key in cache)
+        for key in reversed(list(most_recent_first)):
+            self._move_to_head(cache[key])
+        return results
+
+    def put_many(self, items) -> None:
+        """
+        Put several key-value pairs at once, same final state as put() per pair
+
+        - Duplicate keys collapse to their last value and last position
+        - Every surviving pair goes through _store(), so subclasses keep
+          their own bookkeeping (weights, TTLs, dirty sets) in bulk too
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        latest = {}
+        for key, value in items:
+            latest.pop(key, None)
+            latest[key] = value
+
+        for key, value in latest.items():
+            self._store(key, value)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+
+def compare_bulk_operations(capacity=1_000, batch_size=32, batches=5_000):
+    """Batches per second: loop over get/put vs get_many/put_many"""
+    key_space = capacity * 2
+    batch_keys = [[(b * 131 + i * 17) % key_space for i in range(batch_size)]
+                  for b in range(batches)]
+    report = {}
+
+    cache = LRUCache(capacity)
+    start = time.perf_counter()
+    for keys in batch_keys:
+        for key in keys:
+            cache.put(key, key)
+        for key in keys:
+            cache.get(key)
+    report["single"] = batches / (time.perf_counter() - start)
+
+    cache = LRUCache(capacity)
+    start = time.perf_counter()
+    for keys in batch_keys:
+        cache.put_many([(key, key) for key in keys])
+        cache.get_many(keys)
+    report["bulk"] = batches / (time.perf_counter() - start)
+    return report
 
 
 class TestLRUCache:
@@ -529,6 +616,46 @@ class TestLRUCache:
         # TODO: Add detailed assertions for expected behavior
         pass
 
+    # CATEGORY 7: BULK OPERATIONS
+    def test_get_many_matches_single_gets(self):
+        """Test get_many returns values and LRU order of sequential gets"""
+        bulk = LRUCache(3)
+        single = LRUCache(3)
+        for cache in (bulk, single):
+            cache.put(1, 1)
+            cache.put(2, 2)
+            cache.put(3, 3)
+
+        assert bulk.get_many([1, 4, 2, 1]) == [single.get(k) for k in [1, 4, 2, 1]]
+        bulk.put(5, 5)
+        single.put(5, 5)
+        assert list(bulk.cache) == list(single.cache)
+        assert bulk.get(3) == single.get(3) == -1
+
+    def test_put_many_matches_single_puts(self):
+        """Test put_many with duplicates and more keys than capacity"""
+        items = [(1, 1), (2, 2), (1, 10), (3, 3), (4, 4), (2, 20)]
+        bulk = LRUCache(3)
+        single = LRUCache(3)
+        bulk.put(9, 9)
+        single.put(9, 9)
+
+        bulk.put_many(items)
+        for key, value in items:
+            single.put(key, value)
+
+        assert {k: n.val for k, n in bulk.cache.items()} == {3: 3, 4: 4, 2: 20}
+        assert {k: n.val for k, n in bulk.cache.items()} == \
+            {k: n.val for k, n in single.cache.items()}
+        assert bulk.head.next.key == single.head.next.key == 2
+        assert bulk.tail.prev.key == single.tail.prev.key == 3
+
+    def test_put_many_accepts_dict(self):
+        """Test put_many with a mapping"""
+        cache = LRUCache(2)
+        cache.put_many({1: 100, 2: 200})
+        assert cache.get_many([1, 2, 3]) == [100, 200, -1]
+
 
 if __name__ == "__main__":
     test_suite = TestLRUCache()
@@ -565,6 +692,11 @@ if __name__ == "__main__":
         ("Integration Tests", [
             "test_leetcode_example_1",
             "test_leetcode_example_2"
+        ]),
+        ("Bulk Operations", [
+            "test_get_many_matches_single_gets",
+            "test_put_many_matches_single_puts",
+            "test_put_many_accepts_dict"
         ])
     ]
     
@@ -594,4 +726,8 @@ if __name__ == "__main__":
     print("• Focus on understanding LRU behavior through testing")
     print("• Progressive complexity from basic to integration tests")
     print("• Emphasis on tracing data structure state changes")
-    print("• Real-world examples for practical application")
\ No newline at end of file
+    print("• Real-world examples for practical application")
+
+    bulk_report = compare_bulk_operations()
+    print(f"\nBulk vs single: {bulk_report['bulk']:,.0f} vs "
+          f"{bulk_report['single']:,.0f} batches/s")
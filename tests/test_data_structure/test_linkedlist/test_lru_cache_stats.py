@@ -0,0 +1,268 @@
+import time
+
+import pytest
+
+from test_lru_cache import LRUCache
+from test_ttl_lru_cache import FakeClock, TTLLRUCache
+
+
+class LatencyHistogram:
+    """
+    Log2 histogram of latencies in nanoseconds
+
+    bucket i counts samples with bit_length(ns) == i, i.e. in [2^(i-1), 2^i)
+    Recording is one int.bit_length() and one list increment.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+
+    def record(self, nanoseconds: int) -> None:
+        self.buckets[min(nanoseconds.bit_length(), 63)] += 1
+        self.count += 1
+
+    def percentile(self, p: float) -> int:
+        """Upper bound (ns) of the bucket holding the p-th percentile"""
+        if not self.count:
+            return 0
+        rank = p / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return 1 << index
+        return 1 << 63
+
+
+class CacheStats:
+    """Counters collected by an instrumented cache"""
+
+    def __init__(self, latency_sample_every: int = 0):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.inserts = 0
+        self.updates = 0
+        self.latency_sample_every = latency_sample_every
+        self.get_latency = LatencyHistogram()
+        self.put_latency = LatencyHistogram()
+        self.calls = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "inserts": self.inserts,
+            "updates": self.updates,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class StatsMixin:
+    """
+    Counting versions of the _lookup/_store/_remove_tail hooks
+
+    Mixed in front of a cache class by enable_stats(); a cache that never
+    had stats enabled keeps its original methods and pays nothing.
+    Counting in the hooks covers get/put and get_many/put_many alike, and
+    a hit is a found entry, whatever its value (-1 included).
+    """
+
+    def _sample_latency(self) -> bool:
+        stats = self.stats
+        if not stats.latency_sample_every:
+            return False
+        stats.calls += 1
+        return stats.calls % stats.latency_sample_every == 0
+
+    def get(self, key):
+        if not self._sample_latency():
+            return super().get(key)
+        start = time.perf_counter_ns()
+        result = super().get(key)
+        self.stats.get_latency.record(time.perf_counter_ns() - start)
+        return result
+
+    def put(self, key, value, *args, **kwargs) -> None:
+        if not self._sample_latency():
+            return super().put(key, value, *args, **kwargs)
+        start = time.perf_counter_ns()
+        super().put(key, value, *args, **kwargs)
+        self.stats.put_latency.record(time.perf_counter_ns() - start)
+
+    def put_many(self, items) -> None:
+        # put_many stores each key once; every collapsed duplicate is a
+        # write put() would have counted as an update
+        if not isinstance(items, dict):
+            items = list(items)
+            self.stats.updates += len(items) - len({key for key, _ in items})
+        super().put_many(items)
+
+    def _lookup(self, key):
+        node = super()._lookup(key)
+        if node is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return node
+
+    def _store(self, key, value, *args, **kwargs) -> None:
+        if key in self.cache:
+            self.stats.updates += 1
+        else:
+            self.stats.inserts += 1
+        super()._store(key, value, *args, **kwargs)
+
+    def _remove_tail(self):
+        self.stats.evictions += 1
+        return super()._remove_tail()
+
+
+_instrumented_classes = {}
+
+
+def instrumented_class(cache_class):
+    """StatsMixin + cache_class, built once per cache class"""
+    if cache_class not in _instrumented_classes:
+        _instrumented_classes[cache_class] = type(
+            f"Instrumented{cache_class.__name__}", (StatsMixin, cache_class), {})
+    return _instrumented_classes[cache_class]
+
+
+def enable_stats(cache, latency_sample_every: int = 0) -> CacheStats:
+    """
+    Swap cache onto its instrumented class and start counting
+
+    latency_sample_every=N times one in N get/put calls (0 = never).
+    """
+    if isinstance(cache, StatsMixin):
+        return cache.stats
+    cache.__class__ = instrumented_class(type(cache))
+    cache.stats = CacheStats(latency_sample_every)
+    return cache.stats
+
+
+def disable_stats(cache) -> CacheStats:
+    """Swap cache back to its plain class, return the final stats"""
+    if not isinstance(cache, StatsMixin):
+        return None
+    stats = cache.stats
+    cache.__class__ = type(cache).__mro__[2]
+    del cache.stats
+    return stats
+
+
+def measure_overhead(capacity=1_000, ops=200_000):
+    """ops/s of plain, counting and latency-sampling caches"""
+    report = {}
+    for name, sample_every in [("plain", None), ("counters", 0),
+                               ("sampled_1_in_64", 64)]:
+        cache = LRUCache(capacity)
+        if sample_every is not None:
+            enable_stats(cache, sample_every)
+        start = time.perf_counter()
+        for i in range(ops):
+            key = (i * 7919) % (capacity * 2)
+            if cache.get(key) == -1:
+                cache.put(key, i)
+        report[name] = ops / (time.perf_counter() - start)
+    return report
+
+
+class TestCacheStats:
+
+    def test_counts_hits_misses_inserts_updates_evictions(self):
+        cache = LRUCache(2)
+        stats = enable_stats(cache)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.put(1, 10)
+        cache.put(3, 3)
+        assert cache.get(1) == 10
+        assert cache.get(2) == -1
+
+        assert stats.as_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 1,
+            "inserts": 3,
+            "updates": 1,
+            "hit_ratio": 0.5,
+        }
+
+    def test_counts_bulk_operations(self):
+        cache = LRUCache(2)
+        stats = enable_stats(cache)
+        cache.put_many([(1, -1), (2, 2), (1, 10), (3, 3)])
+        assert cache.get_many([1, 2, 3, 3]) == [10, -1, 3, 3]
+        cache.put(4, -1)
+        assert cache.get(4) == -1
+
+        assert stats.as_dict() == {
+            "hits": 4,
+            "misses": 1,
+            "evictions": 2,
+            "inserts": 4,
+            "updates": 1,
+            "hit_ratio": 0.8,
+        }
+
+        single = LRUCache(2)
+        single_stats = enable_stats(single)
+        for key, value in [(1, -1), (2, 2), (1, 10), (3, 3)]:
+            single.put(key, value)
+        bulk = LRUCache(2)
+        bulk_stats = enable_stats(bulk)
+        bulk.put_many([(1, -1), (2, 2), (1, 10), (3, 3)])
+        assert (bulk_stats.inserts, bulk_stats.updates) == \
+            (single_stats.inserts, single_stats.updates) == (3, 1)
+
+    def test_disabled_cache_keeps_plain_methods(self):
+        cache = LRUCache(2)
+        enable_stats(cache)
+        cache.put(1, 1)
+        stats = disable_stats(cache)
+        assert type(cache) is LRUCache
+        assert not hasattr(cache, "stats")
+        cache.get(1)
+        assert stats.hits == 0
+        assert cache.get(1) == 1
+
+    def test_latency_sampling(self):
+        cache = LRUCache(4)
+        stats = enable_stats(cache, latency_sample_every=2)
+        for key in range(10):
+            cache.put(key, key)
+            cache.get(key)
+        assert stats.get_latency.count + stats.put_latency.count == 10
+        assert stats.get_latency.percentile(50) > 0
+
+    def test_works_on_cache_subclasses(self):
+        clock = FakeClock()
+        cache = TTLLRUCache(2, clock=clock)
+        stats = enable_stats(cache)
+        cache.put(1, 1, ttl=5)
+        clock.now = 10
+        assert cache.get(1) == -1
+        assert stats.misses == 1
+        assert disable_stats(cache) is stats
+        assert type(cache) is TTLLRUCache
+
+    def test_histogram_percentile(self):
+        histogram = LatencyHistogram()
+        for nanoseconds in (100, 100, 100, 5000):
+            histogram.record(nanoseconds)
+        assert histogram.percentile(50) == 128
+        assert histogram.percentile(100) == 8192
+
+
+if __name__ == "__main__":
+    for name, ops_per_sec in measure_overhead().items():
+        print(f"{name:>16}: {ops_per_sec:>12,.0f} ops/s")
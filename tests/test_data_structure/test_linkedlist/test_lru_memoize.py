@@ -0,0 +1,198 @@
+import functools
+import time
+from collections import namedtuple
+
+import pytest
+
+from test_lru_cache import LRUCache
+from test_lru_cache_stats import enable_stats
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+_KWARGS_MARK = object()
+
+
+def make_key(args, kwargs, typed):
+    """
+    Hashable cache key from call arguments
+
+    f(1, 2, x=3)  ──►  (1, 2, MARK, 'x', 3)
+    typed=True also appends the argument types, so f(1) and f(1.0)
+    get separate entries.
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,)
+        for item in kwargs.items():
+            key += item
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for value in kwargs.values())
+    if len(key) == 1 and type(key[0]) in (int, str):
+        return key[0]
+    return key
+
+
+def lru_memoize(capacity: int = 128, typed: bool = False):
+    """
+    Memoize a pure function with an LRUCache of the given capacity
+
+    Like functools.lru_cache, the wrapper exposes cache_info() and
+    cache_clear(). Hits and misses are counted by the wrapper (a cached
+    value may legitimately be -1, LRUCache's miss marker), evictions come
+    from the instrumented cache.
+    """
+    def decorator(func):
+        cache = LRUCache(capacity)
+        stats = enable_stats(cache)
+        counts = {"hits": 0, "misses": 0}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs, typed)
+            if key in cache.cache:
+                counts["hits"] += 1
+                return cache.get(key)
+
+            counts["misses"] += 1
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return value
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(counts["hits"], counts["misses"], stats.evictions,
+                             capacity, len(cache))
+
+        def cache_clear() -> None:
+            nonlocal cache, stats
+            cache = LRUCache(capacity)
+            stats = enable_stats(cache)
+            counts["hits"] = counts["misses"] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def word_break_memo(s, word_dict):
+    """
+    Top-down word_break: can_break(i) answers "can s[i:] be segmented?"
+
+    Same subproblems as dp[i] in test_1dp/test_wordBreak.py, but solved
+    recursively with every sub-result memoized by lru_memoize. The memo is
+    filled from the end of s, so can_break(end) is always cached by the
+    time can_break(start) asks for it: recursion stays one level deep and
+    long inputs never reach the interpreter's recursion limit.
+    """
+    words = set(word_dict)
+    n = len(s)
+
+    @lru_memoize(capacity=n + 1)
+    def can_break(start):
+        if start == n:
+            return True
+        return any(s[start:end] in words and can_break(end)
+                   for end in range(start + 1, n + 1))
+
+    for start in range(n, -1, -1):
+        result = can_break(start)
+    return result
+
+
+def word_break_plain(s, word_dict):
+    """Same recursion without memoization (exponential on bad inputs)"""
+    words = set(word_dict)
+    n = len(s)
+
+    def can_break(start):
+        if start == n:
+            return True
+        return any(s[start:end] in words and can_break(end)
+                   for end in range(start + 1, n + 1))
+
+    return can_break(0)
+
+
+def compare_memoization(length=22):
+    """Seconds for the worst-case 'aaa...ab' input with and without memo"""
+    s = "a" * length + "b"
+    word_dict = ["a", "aa", "aaa"]
+    report = {}
+    for name, solver in [("plain", word_break_plain), ("memo", word_break_memo)]:
+        start = time.perf_counter()
+        solver(s, word_dict)
+        report[name] = time.perf_counter() - start
+    return report
+
+
+class TestLRUMemoize:
+
+    def test_caches_results_and_reports_info(self):
+        calls = []
+
+        @lru_memoize(capacity=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+        assert square.cache_info() == CacheInfo(1, 1, 0, 2, 1)
+
+        square(4)
+        square(5)
+        assert square.cache_info().evictions == 1
+        assert square.cache_info().currsize == 2
+
+    def test_kwargs_and_typed_keys(self):
+        @lru_memoize(capacity=8, typed=True)
+        def add(a, b=0):
+            return a + b
+
+        add(1, b=2)
+        add(1, b=2)
+        add(1.0, b=2)
+        info = add.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+        assert make_key((1,), {"b": 2}, False) != make_key((1, 2), {}, False)
+
+    def test_cached_minus_one_is_a_hit(self):
+        @lru_memoize()
+        def minus_one():
+            return -1
+
+        assert minus_one() == -1
+        assert minus_one() == -1
+        assert minus_one.cache_info().hits == 1
+
+    def test_cache_clear(self):
+        @lru_memoize(capacity=4)
+        def identity(x):
+            return x
+
+        identity(1)
+        identity.cache_clear()
+        assert identity.cache_info() == CacheInfo(0, 0, 0, 4, 0)
+        assert identity.__name__ == "identity"
+
+    @pytest.mark.parametrize("s, word_dict, expected", [
+        ("leetcode", ["leet", "code"], True),
+        ("applepenapple", ["apple", "pen"], True),
+        ("catsandog", ["cats", "dog", "sand", "and", "cat"], False),
+        ("", ["a", "b"], True),
+        ("a" * 200 + "b", ["a", "aa", "aaa"], False),
+        ("a" * 400 + "b", ["a", "aa", "aaa"], False),
+        ("ab" * 2_000, ["a", "ab", "b"], True),
+    ])
+    def test_word_break_memo(self, s, word_dict, expected):
+        assert word_break_memo(s, word_dict) == expected
+
+
+if __name__ == "__main__":
+    for name, seconds in compare_memoization().items():
+        print(f"{name:>5}: {seconds * 1000:10.2f} ms")
@@ -0,0 +1,250 @@
+import gc
+import mmap
+import struct
+import time
+from array import array
+from collections import deque
+from itertools import repeat
+
+import pytest
+
+from test_array_lru_cache import ArrayLRUCache
+from test_lru_cache import ListNode, LRUCache
+
+
+MAGIC = b"LRUSNAP1"
+HEADER = struct.Struct("=8sQQ")
+
+
+def _entries_mru_first(cache):
+    """(key, value) pairs from head to tail of an LRUCache or ArrayLRUCache"""
+    if isinstance(cache, ArrayLRUCache):
+        slot = cache.next[0]
+        while slot:
+            yield cache.keys[slot], cache.vals[slot]
+            slot = cache.next[slot]
+        return
+
+    node = cache.head.next
+    while node is not cache.tail:
+        yield node.key, node.val
+        node = node.next
+
+
+def dump(cache, path) -> int:
+    """
+    Write cache entries to path in recency order (MRU first)
+
+    FILE LAYOUT (native byte order):
+    ================================
+
+    ┌──────────┬──────────┬───────┬──────────────────┬──────────────────┐
+    │ "LRUSNAP1"│ capacity │ count │ keys: count×int64│ vals: count×int64│
+    └──────────┴──────────┴───────┴──────────────────┴──────────────────┘
+
+    Two flat int64 arrays instead of per-entry records, so load() can
+    view them straight out of the mapped file. Returns the entry count.
+    Only int64 keys and values fit; any other entry raises ValueError
+    before the file is touched.
+    """
+    keys = array('q')
+    vals = array('q')
+    for key, value in _entries_mru_first(cache):
+        try:
+            keys.append(key)
+            vals.append(value)
+        except (TypeError, OverflowError):
+            raise ValueError("Snapshots hold int64 keys and values only, "
+                             f"got {key!r}: {value!r}") from None
+    _write_snapshot(path, cache.capacity, keys, vals)
+    return len(keys)
+
+
+def _write_snapshot(path, capacity: int, keys: array, vals: array) -> None:
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, capacity, len(keys)))
+        keys.tofile(f)
+        vals.tofile(f)
+
+
+def _read_snapshot(path):
+    """(capacity, keys, vals) from a snapshot file, via mmap"""
+    with open(path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        magic, capacity, count = HEADER.unpack_from(mapped)
+        if magic != MAGIC:
+            raise ValueError(f"Not an LRU snapshot: {path}")
+        keys_start = HEADER.size
+        vals_start = keys_start + count * 8
+        if len(mapped) != vals_start + count * 8:
+            raise ValueError(f"Truncated LRU snapshot: {path}")
+
+        view = memoryview(mapped)
+        with view[keys_start:vals_start].cast('q') as key_view, \
+                view[vals_start:].cast('q') as val_view:
+            keys = key_view.tolist()
+            vals = val_view.tolist()
+        view.release()
+    return capacity, keys, vals
+
+
+def _restore_nodes(cache: LRUCache, keys, vals) -> None:
+    """
+    Link nodes head → tail in file order, no per-entry _add_to_head
+
+    Nodes are allocated bare and filled by map(setattr, ...), which loops
+    in C: a million ListNode.__init__ calls would cost more than the rest
+    of load() put together.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # a million new nodes would otherwise trigger many GC passes
+    try:
+        nodes = list(map(ListNode.__new__, repeat(ListNode, len(keys))))
+        deque(map(setattr, nodes, repeat("key"), keys), maxlen=0)
+        deque(map(setattr, nodes, repeat("val"), vals), maxlen=0)
+        chain = [cache.head] + nodes + [cache.tail]
+        deque(map(setattr, chain[1:], repeat("prev"), chain), maxlen=0)
+        deque(map(setattr, chain, repeat("next"), chain[1:]), maxlen=0)
+        cache.cache = dict(zip(keys, nodes))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def load(path, capacity: int = 0, cache_class=LRUCache):
+    """
+    Rebuild a cache from a snapshot with its original eviction order
+
+    capacity=0 keeps the capacity stored in the file. A smaller capacity
+    keeps only the most recently used entries. cache_class may be
+    LRUCache or ArrayLRUCache; the array-backed cache restores a million
+    entries several times faster because it creates no per-entry objects.
+    """
+    stored_capacity, keys, vals = _read_snapshot(path)
+    capacity = capacity or stored_capacity
+    if len(keys) > capacity:
+        keys = keys[:capacity]
+        vals = vals[:capacity]
+    if cache_class is ArrayLRUCache:
+        return ArrayLRUCache.from_entries(capacity, keys, vals)
+
+    cache = cache_class(capacity)
+    _restore_nodes(cache, keys, vals)
+    return cache
+
+
+def measure_restore(path, n=1_000_000):
+    """Seconds to dump an n-entry cache and to load it per cache class"""
+    cache = LRUCache(n)
+    cache.put_many((i, i * 2) for i in range(n))
+    start = time.perf_counter()
+    dump(cache, path)
+    report = {"dump": time.perf_counter() - start}
+    for name, cache_class in [("load_node", LRUCache),
+                              ("load_array", ArrayLRUCache)]:
+        start = time.perf_counter()
+        load(path, cache_class=cache_class)
+        report[name] = time.perf_counter() - start
+    return report
+
+
+class TestLRUSnapshot:
+
+    def test_round_trip_keeps_eviction_order(self, tmp_path):
+        cache = LRUCache(3)
+        cache.put(1, 10)
+        cache.put(2, 20)
+        cache.put(3, 30)
+        cache.get(1)
+        path = tmp_path / "cache.snap"
+        assert dump(cache, path) == 3
+
+        restored = load(path)
+        assert restored.capacity == 3
+        restored.put(4, 40)
+        assert restored.get(2) == -1
+        assert restored.get_many([1, 3, 4]) == [10, 30, 40]
+
+    def test_smaller_capacity_keeps_most_recent(self, tmp_path):
+        cache = LRUCache(4)
+        for key in range(4):
+            cache.put(key, key)
+        path = tmp_path / "cache.snap"
+        dump(cache, path)
+
+        restored = load(path, capacity=2)
+        assert list(restored.cache) == [3, 2]
+        assert restored.tail.prev.key == 2
+
+    def test_empty_cache(self, tmp_path):
+        path = tmp_path / "empty.snap"
+        dump(LRUCache(5), path)
+        restored = load(path)
+        assert len(restored) == 0
+        assert restored.head.next is restored.tail
+
+    @pytest.mark.parametrize("capacity", [0, 3])
+    def test_array_cache_round_trip(self, tmp_path, capacity):
+        cache = ArrayLRUCache(5)
+        for key in range(6):
+            cache.put(key, key * 10)
+        cache.get(2)
+        path = tmp_path / "cache.snap"
+        dump(cache, path)
+
+        restored = load(path, capacity=capacity, cache_class=ArrayLRUCache)
+        expected = list(_entries_mru_first(cache))[:restored.capacity]
+        assert list(_entries_mru_first(restored)) == expected
+        for key in range(100, 110):
+            restored.put(key, key)
+        assert sorted(restored.cache) == list(range(110 - restored.capacity, 110))
+
+    def test_million_entry_restore(self, tmp_path):
+        """Functional check only; restore timings are in measure_restore()"""
+        n = 1_000_000
+        path = tmp_path / "big.snap"
+        _write_snapshot(path, n, array('q', range(n)), array('q', range(0, 2 * n, 2)))
+        for cache_class in (LRUCache, ArrayLRUCache):
+            restored = load(path, cache_class=cache_class)
+            assert len(restored.cache) == n
+            entries = _entries_mru_first(restored)
+            assert next(entries) == (0, 0)
+            assert sum(1 for _ in entries) == n - 1
+            restored.put(n, 0)
+            assert restored.get(n - 1) == -1
+            assert restored.get(n - 2) == 2 * (n - 2)
+            del restored, entries
+
+    def test_rejects_entries_that_are_not_int64(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        for key, value in [("k", 1), (1, "v"), (1, b"x"), (1, 2 ** 63)]:
+            cache = LRUCache(2)
+            cache.put(key, value)
+            with pytest.raises(ValueError, match="int64"):
+                dump(cache, path)
+            assert not path.exists()
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "junk.snap"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            load(path)
+
+    def test_rejects_truncated_file(self, tmp_path):
+        cache = LRUCache(2)
+        cache.put(1, 1)
+        path = tmp_path / "cache.snap"
+        dump(cache, path)
+        path.write_bytes(path.read_bytes()[:-4])
+        with pytest.raises(ValueError):
+            load(path)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = measure_restore(os.path.join(directory, "cache.snap"))
+    for name, seconds in report.items():
+        print(f"1M entries {name:>10}: {seconds:.3f} s")
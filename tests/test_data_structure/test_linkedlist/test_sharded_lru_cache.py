@@ -0,0 +1,161 @@
+import threading
+import time
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class LockedLRUCache:
+    """
+    One LRUCache behind one global lock
+
+    This is the baseline ShardedLRUCache is measured against: every
+    thread serializes on the same lock for every get/put.
+    """
+
+    def __init__(self, capacity: int):
+        self.cache = LRUCache(capacity)
+        self.lock = threading.Lock()
+
+    def get(self, key: int) -> int:
+        with self.lock:
+            return self.cache.get(key)
+
+    def put(self, key: int, value: int) -> None:
+        with self.lock:
+            self.cache.put(key, value)
+
+
+class ShardedLRUCache:
+    """
+    Thread-safe LRU Cache split into N independent segments
+
+    SHARDING:
+    =========
+
+    key ──hash──► shard = hash(key) % N
+
+    ┌────────────────┐ ┌────────────────┐     ┌────────────────┐
+    │ lock 0         │ │ lock 1         │ ... │ lock N-1       │
+    │ LRUCache(c0)   │ │ LRUCache(c1)   │     │ LRUCache(cN-1) │
+    └────────────────┘ └────────────────┘     └────────────────┘
+
+    - Total capacity is split across shards (c0 + ... + cN-1 == capacity)
+    - Threads touching different shards never contend
+    - Recency is per shard: eviction removes the LRU entry of that shard,
+      which approximates global LRU when keys hash evenly
+    """
+
+    def __init__(self, capacity: int, num_shards: int = 8):
+        if num_shards <= 0:
+            raise ValueError("Number of shards must larger than 0")
+        if capacity < num_shards:
+            raise ValueError("Capacity must be at least the number of shards")
+        self.capacity = capacity
+        self.num_shards = num_shards
+
+        base, extra = divmod(capacity, num_shards)
+        self.shards = [LRUCache(base + (1 if i < extra else 0))
+                       for i in range(num_shards)]
+        self.locks = [threading.Lock() for _ in range(num_shards)]
+
+    def _shard_index(self, key: int) -> int:
+        return hash(key) % self.num_shards
+
+    def get(self, key: int) -> int:
+        index = self._shard_index(key)
+        with self.locks[index]:
+            return self.shards[index].get(key)
+
+    def put(self, key: int, value: int) -> None:
+        index = self._shard_index(key)
+        with self.locks[index]:
+            self.shards[index].put(key, value)
+
+    def __len__(self) -> int:
+        return sum(len(shard.cache) for shard in self.shards)
+
+
+def measure_threaded_throughput(cache, num_threads, ops_per_thread, key_space):
+    """Total get-or-put operations per second across num_threads threads"""
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(seed):
+        barrier.wait()
+        for i in range(ops_per_thread):
+            key = (seed * 104729 + i * 7919) % key_space
+            if cache.get(key) == -1:
+                cache.put(key, i)
+
+    threads = [threading.Thread(target=worker, args=(t,))
+               for t in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * ops_per_thread / elapsed
+
+
+def compare_scaling(capacity=10_000, thread_counts=(1, 2, 4, 8),
+                    ops_per_thread=100_000, num_shards=16):
+    """Throughput (ops/s) of locked vs sharded cache per thread count"""
+    report = {}
+    for num_threads in thread_counts:
+        locked = LockedLRUCache(capacity)
+        sharded = ShardedLRUCache(capacity, num_shards)
+        report[num_threads] = {
+            "locked": measure_threaded_throughput(
+                locked, num_threads, ops_per_thread, capacity * 2),
+            "sharded": measure_threaded_throughput(
+                sharded, num_threads, ops_per_thread, capacity * 2),
+        }
+    return report
+
+
+class TestShardedLRUCache:
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            ShardedLRUCache(10, 0)
+        with pytest.raises(ValueError):
+            ShardedLRUCache(3, 4)
+
+    def test_capacity_split_across_shards(self):
+        cache = ShardedLRUCache(10, 4)
+        assert [shard.capacity for shard in cache.shards] == [3, 3, 2, 2]
+
+    def test_single_thread_put_get(self):
+        cache = ShardedLRUCache(8, 2)
+        for key in range(8):
+            cache.put(key, key * 10)
+        for key in range(8):
+            assert cache.get(key) == key * 10
+        assert cache.get(100) == -1
+
+    def test_never_exceeds_total_capacity(self):
+        cache = ShardedLRUCache(16, 4)
+        for key in range(1000):
+            cache.put(key, key)
+        assert len(cache) <= 16
+
+    def test_concurrent_access_keeps_lists_consistent(self):
+        cache = ShardedLRUCache(64, 8)
+        measure_threaded_throughput(cache, 4, 2000, 256)
+        for shard in cache.shards:
+            node = shard.head.next
+            seen = 0
+            while node is not shard.tail:
+                assert shard.cache[node.key] is node
+                node = node.next
+                seen += 1
+            assert seen == len(shard.cache) <= shard.capacity
+
+
+if __name__ == "__main__":
+    for num_threads, stats in compare_scaling().items():
+        print(f"{num_threads} threads: locked {stats['locked']:>12,.0f} ops/s, "
+              f"sharded {stats['sharded']:>12,.0f} ops/s")
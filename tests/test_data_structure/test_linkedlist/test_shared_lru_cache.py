@@ -0,0 +1,331 @@
+import multiprocessing
+import random
+import time
+from multiprocessing import shared_memory
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class SharedLRUCache:
+    """
+    LRU Cache living in one multiprocessing.shared_memory segment
+
+    Every process that attaches sees the same entries, so hot data is
+    stored once per host instead of once per worker.
+
+    SEGMENT LAYOUT (slot 0 is the dummy head/tail, like ListNode dummies):
+    =====================================================================
+
+    ┌────────────┬──────────────┬──────────────┬───────────┬───────────┬────────────┐
+    │ header (q) │ keys (q)     │ vals (q)     │ prev (i)  │ next (i)  │ table (i)  │
+    │ 5 fields   │ capacity + 1 │ capacity + 1 │ cap + 1   │ cap + 1   │ 2^bits     │
+    └────────────┴──────────────┴──────────────┴───────────┴───────────┴────────────┘
+
+    - header: magic, capacity, table_bits, size, free_head
+    - table: open addressing (linear probing) key → slot, 0 = empty;
+      deletes use backward shifting, so there are no tombstones
+    - prev/next: the recency list as slot indexes, free slots chained
+      through next[] exactly like ArrayLRUCache
+
+    Keys and values are int64. One multiprocessing.Lock guards every
+    operation; a hit costs one probe sequence plus four index writes.
+    """
+
+    MAGIC = 0x4C52555348415245  # "LRUSHARE"
+    HEADER_FIELDS = 5
+
+    def __init__(self, shm, lock, create):
+        self.shm = shm
+        self.lock = lock
+        self.name = shm.name
+        buf = shm.buf
+        self._header = buf[:self.HEADER_FIELDS * 8].cast('q')
+        capacity = self._header[1]
+        table_bits = self._header[2]
+        self.capacity = capacity
+        self._bits = table_bits
+        self._mask = (1 << table_bits) - 1
+
+        size = capacity + 1
+        offset = self.HEADER_FIELDS * 8
+        self.keys = buf[offset:offset + size * 8].cast('q')
+        offset += size * 8
+        self.vals = buf[offset:offset + size * 8].cast('q')
+        offset += size * 8
+        self.prev = buf[offset:offset + size * 4].cast('i')
+        offset += size * 4
+        self.next = buf[offset:offset + size * 4].cast('i')
+        offset += size * 4
+        self.table = buf[offset:offset + (1 << table_bits) * 4].cast('i')
+
+        if create:
+            for slot in range(1, capacity):
+                self.next[slot] = slot + 1
+            self.next[capacity] = 0
+            self.next[0] = 0
+            self.prev[0] = 0
+            self._header[3] = 0
+            self._header[4] = 1
+            self._header[0] = self.MAGIC
+        elif self._header[0] != self.MAGIC:
+            raise ValueError(f"Not a SharedLRUCache segment: {shm.name}")
+
+    @classmethod
+    def segment_size(cls, capacity: int, table_bits: int) -> int:
+        size = capacity + 1
+        return cls.HEADER_FIELDS * 8 + size * 24 + (1 << table_bits) * 4
+
+    @classmethod
+    def create(cls, capacity: int, lock=None, name=None):
+        """Allocate a new segment; pass the returned cache to workers"""
+        if capacity <= 0:
+            raise ValueError("Capacity must larger than 0")
+        table_bits = max(2, (2 * capacity - 1).bit_length())
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=cls.segment_size(capacity, table_bits))
+        header = shm.buf[:cls.HEADER_FIELDS * 8].cast('q')
+        header[1] = capacity
+        header[2] = table_bits
+        header.release()
+        return cls(shm, lock or multiprocessing.Lock(), create=True)
+
+    @classmethod
+    def attach(cls, name: str, lock):
+        """Open an existing segment by name (lock must be the creator's)"""
+        return cls(shared_memory.SharedMemory(name=name), lock, create=False)
+
+    def __reduce__(self):
+        return (SharedLRUCache.attach, (self.name, self.lock))
+
+    def close(self) -> None:
+        for view in (self._header, self.keys, self.vals, self.prev,
+                     self.next, self.table):
+            view.release()
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+    def __len__(self) -> int:
+        return self._header[3]
+
+    # Hash table ----------------------------------------------------------
+
+    def _home(self, key: int) -> int:
+        mixed = (key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return mixed >> (64 - self._bits)
+
+    def _probe(self, key: int) -> int:
+        """Table index holding key, or of the empty cell where it would go"""
+        table, keys, mask = self.table, self.keys, self._mask
+        index = self._home(key)
+        while table[index] and keys[table[index]] != key:
+            index = (index + 1) & mask
+        return index
+
+    def _table_delete(self, index: int) -> None:
+        """Empty table[index], shifting later cluster members back"""
+        table, keys, mask = self.table, self.keys, self._mask
+        table[index] = 0
+        hole = index
+        probe = index
+        while True:
+            probe = (probe + 1) & mask
+            slot = table[probe]
+            if not slot:
+                return
+            home = self._home(keys[slot])
+            # Move slot into the hole unless its home lies in (hole, probe]
+            if (hole < probe and (home <= hole or home > probe)) or \
+                    (hole > probe and home <= hole and home > probe):
+                table[hole] = slot
+                table[probe] = 0
+                hole = probe
+
+    # Recency list (same moves as LRUCache, on slot indexes) ---------------
+
+    def _add_to_head(self, slot: int) -> None:
+        current_first = self.next[0]
+        self.prev[slot] = 0
+        self.next[slot] = current_first
+        self.prev[current_first] = slot
+        self.next[0] = slot
+
+    def _remove_node(self, slot: int) -> None:
+        prev_slot = self.prev[slot]
+        next_slot = self.next[slot]
+        self.next[prev_slot] = next_slot
+        self.prev[next_slot] = prev_slot
+
+    def _evict_tail(self) -> None:
+        lru_slot = self.prev[0]
+        self._remove_node(lru_slot)
+        self._table_delete(self._probe(self.keys[lru_slot]))
+        self.next[lru_slot] = self._header[4]
+        self._header[4] = lru_slot
+        self._header[3] -= 1
+
+    # Public API ----------------------------------------------------------
+
+    def get(self, key: int) -> int:
+        with self.lock:
+            slot = self.table[self._probe(key)]
+            if not slot:
+                return -1
+            self._remove_node(slot)
+            self._add_to_head(slot)
+            return self.vals[slot]
+
+    def put(self, key: int, value: int) -> None:
+        with self.lock:
+            index = self._probe(key)
+            slot = self.table[index]
+            if slot:
+                self.vals[slot] = value
+                self._remove_node(slot)
+                self._add_to_head(slot)
+                return
+
+            if self._header[3] >= self.capacity:
+                self._evict_tail()
+                index = self._probe(key)
+
+            slot = self._header[4]
+            self._header[4] = self.next[slot]
+            self.keys[slot] = key
+            self.vals[slot] = value
+            self.table[index] = slot
+            self._add_to_head(slot)
+            self._header[3] += 1
+
+
+def _worker(cache, worker_id, ops, key_space, results):
+    hits = 0
+    for i in range(ops):
+        key = (worker_id * 7 + i * 7919) % key_space
+        if cache.get(key) != -1:
+            hits += 1
+        else:
+            cache.put(key, key)
+    results.put(hits)
+
+
+def _skewed_worker(cache, worker_id, ops, key_space, results):
+    """Same as _worker but with a Pareto-skewed (hot set) key stream"""
+    rng = random.Random(worker_id)
+    hits = 0
+    for _ in range(ops):
+        key = min(int(rng.paretovariate(0.5)), key_space)
+        if cache.get(key) != -1:
+            hits += 1
+        else:
+            cache.put(key, key)
+    results.put(hits)
+
+
+def compare_shared_vs_private(num_procs=4, capacity=2_000, ops=50_000,
+                              key_space=100_000):
+    """Hit ratio and wall time: one shared cache vs one LRUCache per process"""
+    context = multiprocessing.get_context()
+    report = {}
+    for name in ("private", "shared"):
+        shared = SharedLRUCache.create(capacity, context.Lock())
+        results = context.Queue()
+        processes = [
+            context.Process(target=_skewed_worker, args=(
+                shared if name == "shared" else LRUCache(capacity // num_procs),
+                worker_id, ops, key_space, results))
+            for worker_id in range(num_procs)]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        hits = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        report[name] = {"hit_ratio": hits / (num_procs * ops),
+                        "seconds": time.perf_counter() - start}
+        shared.close()
+        shared.unlink()
+    return report
+
+
+class TestSharedLRUCache:
+
+    def setup_method(self):
+        self.cache = SharedLRUCache.create(3)
+
+    def teardown_method(self):
+        self.cache.close()
+        self.cache.unlink()
+
+    def test_leetcode_example_1(self):
+        cache = self.cache
+        cache.put(1, 1)
+        cache.put(2, 2)
+        assert cache.get(1) == 1
+        cache.put(3, 3)
+        cache.put(4, 4)
+        assert cache.get(2) == -1
+        assert cache.get(1) == 1
+        assert len(cache) == 3
+
+    def test_matches_lru_cache_under_churn(self):
+        shared = SharedLRUCache.create(16)
+        reference = LRUCache(16)
+        try:
+            for i in range(5000):
+                key = (i * 31 + i // 5) % 70 - 20
+                if i % 3:
+                    assert shared.get(key) == reference.get(key)
+                else:
+                    shared.put(key, i)
+                    reference.put(key, i)
+            assert len(shared) == len(reference)
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_attach_sees_same_entries(self):
+        self.cache.put(7, 70)
+        other = SharedLRUCache.attach(self.cache.name, self.cache.lock)
+        try:
+            assert other.get(7) == 70
+            other.put(8, 80)
+            assert self.cache.get(8) == 80
+        finally:
+            other.close()
+
+    def test_attach_rejects_foreign_segment(self):
+        foreign = shared_memory.SharedMemory(create=True, size=256)
+        try:
+            with pytest.raises(ValueError):
+                SharedLRUCache.attach(foreign.name, None)
+        finally:
+            foreign.close()
+            foreign.unlink()
+
+    def test_writes_from_child_processes_are_shared(self):
+        results = multiprocessing.Queue()
+        cache = SharedLRUCache.create(64)
+        try:
+            processes = [multiprocessing.Process(
+                target=_worker, args=(cache, worker_id, 200, 32, results))
+                for worker_id in range(2)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                results.get()
+                process.join()
+            assert len(cache) == 32
+            assert all(cache.get(key) == key for key in range(32))
+        finally:
+            cache.close()
+            cache.unlink()
+
+
+if __name__ == "__main__":
+    for name, stats in compare_shared_vs_private().items():
+        print(f"{name:>7}: hit ratio {stats['hit_ratio']:.3f}, "
+              f"{stats['seconds']:.3f} s")
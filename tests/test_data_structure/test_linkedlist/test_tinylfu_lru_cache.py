@@ -0,0 +1,272 @@
+import bisect
+import itertools
+import random
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class CountMinSketch:
+    """
+    Compact frequency estimator with periodic aging
+
+    depth rows of width saturating 4-bit counters (0..15), packed two per
+    byte of a bytearray (even index: low nibble, odd index: high nibble):
+
+              col 0  col 1  col 2  ...  col w-1
+    row 0   [   3      0      7    ...     1   ]
+    row 1   [   0      5      2    ...     0   ]
+    ...
+
+    - increment(key) bumps one counter per row (the row's hash of key)
+    - estimate(key) is the minimum of those counters (never underestimates
+      before aging; collisions only push estimates up)
+    - After sample_size increments every counter is halved, so old
+      popularity fades and the sketch follows a changing workload
+    """
+
+    MAX_COUNT = 15
+    # byte -> byte with both of its nibbles halved, for bytes.translate
+    _HALVED = bytes((byte >> 1) & 0x77 for byte in range(256))
+
+    def __init__(self, width: int, depth: int = 4, sample_size: int = 0):
+        if width <= 0 or depth <= 0:
+            raise ValueError("Width and depth must larger than 0")
+        self.width = width
+        self.depth = depth
+        self.table = bytearray((width * depth + 1) // 2)
+        self.sample_size = sample_size or 10 * width
+        self.additions = 0
+
+    def _indexes(self, key):
+        for row in range(self.depth):
+            yield row * self.width + hash((row, key)) % self.width
+
+    def _count(self, index: int) -> int:
+        return (self.table[index >> 1] >> ((index & 1) << 2)) & 0xF
+
+    def _bump(self, index: int) -> None:
+        if self._count(index) < self.MAX_COUNT:
+            self.table[index >> 1] += 1 << ((index & 1) << 2)
+
+    def estimate(self, key) -> int:
+        return min(self._count(index) for index in self._indexes(key))
+
+    def increment(self, key) -> None:
+        for index in self._indexes(key):
+            self._bump(index)
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def _age(self) -> None:
+        self.table = self.table.translate(self._HALVED)
+        self.additions //= 2
+
+
+_NO_KEY = object()
+
+
+class TinyLFUCache:
+    """
+    W-TinyLFU: a small LRU window in front of a main LRU guarded by an
+    admission filter
+
+    FLOW OF A NEW KEY:
+    ==================
+
+    put(k) ──► window LRU (~1%) ──evict──► candidate
+                                             │
+                 main LRU full? ── no ──► admit candidate
+                        │
+                       yes
+                        │
+      sketch.estimate(candidate) > sketch.estimate(main LRU tail)?
+                 │                          │
+                yes: admit (evict tail)    no: drop candidate
+
+    A one-off scan key is seen once, so it loses against any hot victim
+    and never pushes the hot set out of the main segment.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01):
+        if capacity < 2:
+            raise ValueError("Capacity must be at least 2")
+        self.capacity = capacity
+        window_capacity = min(capacity - 1, max(1, int(capacity * window_ratio)))
+        self.window = LRUCache(window_capacity)
+        self.main = LRUCache(capacity - window_capacity)
+        self.sketch = CountMinSketch(width=max(16, capacity * 4))
+        self._counted_miss = _NO_KEY  # last get() miss, already in the sketch
+
+    def __len__(self) -> int:
+        return len(self.window.cache) + len(self.main.cache)
+
+    def _admit(self, candidate) -> None:
+        main = self.main
+        if len(main.cache) < main.capacity:
+            main.put(candidate.key, candidate.val)
+            return
+
+        victim = main.tail.prev
+        if self.sketch.estimate(candidate.key) > self.sketch.estimate(victim.key):
+            main.put(candidate.key, candidate.val)
+
+    def get(self, key: int) -> int:
+        self.sketch.increment(key)
+        if key in self.window.cache:
+            return self.window.get(key)
+        if key not in self.main.cache:
+            self._counted_miss = key
+        return self.main.get(key)
+
+    def put(self, key: int, value: int) -> None:
+        if key in self.main.cache:
+            self.main.put(key, value)
+            return
+        if key in self.window.cache:
+            self.window.put(key, value)
+            return
+
+        # A put right after its get() missed is the same access: count once
+        if key != self._counted_miss:
+            self.sketch.increment(key)
+        self._counted_miss = _NO_KEY
+        window = self.window
+        if len(window.cache) >= window.capacity:
+            candidate = window._remove_tail()
+            del window.cache[candidate.key]
+            self._admit(candidate)
+        window.put(key, value)
+
+
+def zipf_keys(num_keys, alpha, rng):
+    """Endless Zipf-distributed keys in range(num_keys)"""
+    cumulative = list(itertools.accumulate(
+        1.0 / (rank ** alpha) for rank in range(1, num_keys + 1)))
+    total = cumulative[-1]
+    while True:
+        yield bisect.bisect_left(cumulative, rng.random() * total)
+
+
+def zipf_with_scans(length, num_keys=10_000, alpha=0.9, scan_every=5_000,
+                    scan_length=2_000, seed=0):
+    """Zipf trace interrupted by sequential scans over never-reused keys"""
+    rng = random.Random(seed)
+    zipf = zipf_keys(num_keys, alpha, rng)
+    scan_key = num_keys
+    trace = []
+    while len(trace) < length:
+        trace.extend(itertools.islice(zipf, scan_every))
+        trace.extend(range(scan_key, scan_key + scan_length))
+        scan_key += scan_length
+    return trace[:length]
+
+
+def hit_ratio(cache, trace):
+    hits = 0
+    for key in trace:
+        if cache.get(key) != -1:
+            hits += 1
+        else:
+            cache.put(key, key)
+    return hits / len(trace)
+
+
+def compare_hit_ratios(capacities=(100, 500, 1_000), length=200_000):
+    """LRU vs W-TinyLFU hit ratio on the Zipf-plus-scan trace"""
+    trace = zipf_with_scans(length)
+    return {
+        capacity: {
+            "lru": hit_ratio(LRUCache(capacity), trace),
+            "tinylfu": hit_ratio(TinyLFUCache(capacity), trace),
+        }
+        for capacity in capacities
+    }
+
+
+class TestCountMinSketch:
+
+    def test_estimate_counts_increments(self):
+        sketch = CountMinSketch(width=64, sample_size=1_000)
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+        assert sketch.estimate("hot") >= 5
+        assert sketch.estimate("cold") >= 1
+        assert sketch.estimate("hot") > sketch.estimate("cold")
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(width=8, sample_size=1_000)
+        for _ in range(100):
+            sketch.increment(1)
+        assert sketch.estimate(1) == CountMinSketch.MAX_COUNT
+
+    def test_two_counters_per_byte(self):
+        sketch = CountMinSketch(width=5, depth=3, sample_size=1_000)
+        assert len(sketch.table) == 8
+        for index in range(15):
+            for _ in range(index + 2):
+                sketch._bump(index)
+        expected = [min(index + 2, CountMinSketch.MAX_COUNT) for index in range(15)]
+        assert [sketch._count(index) for index in range(15)] == expected
+        sketch._age()
+        assert [sketch._count(index) for index in range(15)] == \
+            [count >> 1 for count in expected]
+
+    def test_aging_halves_counters(self):
+        sketch = CountMinSketch(width=64, sample_size=10)
+        for _ in range(9):
+            sketch.increment("a")
+        assert sketch.estimate("a") == 9
+        sketch.increment("a")
+        assert sketch.estimate("a") == 5
+
+
+class TestTinyLFUCache:
+
+    def test_basic_put_get(self):
+        cache = TinyLFUCache(4)
+        cache.put(1, 100)
+        assert cache.get(1) == 100
+        cache.put(1, 200)
+        assert cache.get(1) == 200
+        assert cache.get(2) == -1
+
+    def test_each_access_counted_once(self):
+        cache = TinyLFUCache(4)
+        assert cache.get(1) == -1
+        cache.put(1, 100)
+        assert cache.sketch.estimate(1) == 1
+        cache.put(2, 200)
+        assert cache.sketch.estimate(2) == 1
+        assert cache.get(1) == 100
+        assert cache.sketch.estimate(1) == 2
+
+    def test_never_exceeds_capacity(self):
+        cache = TinyLFUCache(10)
+        for key in range(1000):
+            cache.put(key, key)
+        assert len(cache) <= 10
+
+    def test_scan_does_not_flush_hot_set(self):
+        cache = TinyLFUCache(10, window_ratio=0.1)
+        for _ in range(5):
+            for key in range(9):
+                if cache.get(key) == -1:
+                    cache.put(key, key)
+        for key in range(1000, 1100):
+            cache.put(key, key)
+        assert all(key in cache.main.cache for key in range(9))
+
+    def test_beats_lru_on_zipf_plus_scan(self):
+        trace = zipf_with_scans(30_000, num_keys=2_000, scan_every=2_000,
+                                scan_length=500)
+        assert hit_ratio(TinyLFUCache(200), trace) > hit_ratio(LRUCache(200), trace)
+
+
+if __name__ == "__main__":
+    for capacity, ratios in compare_hit_ratios().items():
+        print(f"capacity {capacity:>5}: LRU {ratios['lru']:.3f}, "
+              f"W-TinyLFU {ratios['tinylfu']:.3f}")
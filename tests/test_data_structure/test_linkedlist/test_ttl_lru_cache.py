@@ -0,0 +1,212 @@
+import heapq
+import time
+from typing import Optional
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class TTLLRUCache(LRUCache):
+    """
+    LRU Cache where entries can also expire after a time-to-live
+
+    Two ways an expired entry leaves the cache:
+    1. Lazily: get()/get_many() finds it expired, unlinks it and reports a miss
+    2. In batches: sweep() reclaims every entry whose deadline passed
+
+    TIMER BUCKETS:
+    ==============
+
+    Deadlines are rounded down to ticks of `resolution` seconds.
+    Each tick owns a bucket with the keys expiring in it, and a min-heap
+    holds the ticks that have buckets:
+
+    bucket_ticks (heap): [41, 42, 45]
+    buckets:             {41: {a, b}, 42: {c}, 45: {d}}
+
+    sweep() at tick 42 pops 41 and 42 only, so its cost is proportional
+    to the expired buckets and keys, never to the size of the cache.
+    """
+
+    def __init__(self, capacity: int, resolution: float = 1.0,
+                 clock=time.monotonic):
+        super().__init__(capacity)
+        if resolution <= 0:
+            raise ValueError("Resolution must larger than 0")
+        self.resolution = resolution
+        self.clock = clock
+        self.expires = {}
+        self.buckets = {}
+        self.bucket_ticks = []
+
+    def _tick(self, moment: float) -> int:
+        return int(moment // self.resolution)
+
+    def _schedule(self, key: int, ttl: float) -> None:
+        expire_at = self.clock() + ttl
+        tick = self._tick(expire_at)
+        if tick not in self.buckets:
+            self.buckets[tick] = set()
+            heapq.heappush(self.bucket_ticks, tick)
+        self.buckets[tick].add(key)
+        self.expires[key] = expire_at
+
+    def _unschedule(self, key: int) -> None:
+        expire_at = self.expires.pop(key, None)
+        if expire_at is not None:
+            self.buckets.get(self._tick(expire_at), set()).discard(key)
+
+    def _delete(self, key: int) -> None:
+        node = self.cache.pop(key)
+        self._remove_node(node)
+        self._unschedule(key)
+
+    def _is_expired(self, key: int, now: float) -> bool:
+        expire_at = self.expires.get(key)
+        return expire_at is not None and expire_at <= now
+
+    def _remove_tail(self):
+        lru_node = super()._remove_tail()
+        self._unschedule(lru_node.key)
+        return lru_node
+
+    def sweep(self) -> int:
+        """Remove every expired entry, return how many were removed"""
+        now = self.clock()
+        now_tick = self._tick(now)
+        removed = 0
+        while self.bucket_ticks and self.bucket_ticks[0] <= now_tick:
+            tick = heapq.heappop(self.bucket_ticks)
+            bucket = self.buckets.pop(tick, set())
+            expired = [key for key in bucket if self._is_expired(key, now)]
+            for key in expired:
+                self._delete(key)
+            removed += len(expired)
+
+            # Only the current tick can still hold live keys
+            leftover = bucket.difference(expired)
+            if leftover:
+                self.buckets[tick] = leftover
+                heapq.heappush(self.bucket_ticks, tick)
+                return removed
+        return removed
+
+    def _lookup(self, key: int):
+        if self._is_expired(key, self.clock()):
+            self._delete(key)
+            return None
+        return super()._lookup(key)
+
+    def _store(self, key: int, value: int, ttl: Optional[float] = None) -> None:
+        if key not in self.cache and len(self.cache) >= self.capacity:
+            self.sweep()
+
+        self._unschedule(key)
+        super()._store(key, value)
+        if ttl is not None:
+            self._schedule(key, ttl)
+
+    def put(self, key: int, value: int, ttl: Optional[float] = None) -> None:
+        """
+        Put key-value pair; ttl=None means the entry never expires
+
+        When the cache is full, expired entries are swept first so that
+        capacity eviction does not throw away a live entry needlessly.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must larger than 0")
+        self._store(key, value, ttl)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLLRUCache:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = TTLLRUCache(3, resolution=1.0, clock=self.clock)
+
+    def test_entry_without_ttl_never_expires(self):
+        self.cache.put(1, 100)
+        self.clock.now = 1e9
+        assert self.cache.get(1) == 100
+
+    def test_lazy_expiry_on_get(self):
+        self.cache.put(1, 100, ttl=5)
+        self.clock.now = 4.9
+        assert self.cache.get(1) == 100
+        self.clock.now = 5.0
+        assert self.cache.get(1) == -1
+        assert 1 not in self.cache.cache
+        assert 1 not in self.cache.expires
+
+    def test_bulk_operations_respect_expiry(self):
+        self.cache.put(1, 100, ttl=5)
+        self.cache.put_many([(2, 200), (3, 300)])
+        self.clock.now = 5.0
+        assert self.cache.get_many([1, 2, 3]) == [-1, 200, 300]
+        assert 1 not in self.cache.cache
+        assert 1 not in self.cache.expires
+
+        self.cache.put(4, 400, ttl=1)
+        self.cache.put_many([(4, 401), (5, 500)])
+        self.clock.now = 100
+        assert self.cache.get_many([4, 5]) == [401, 500]
+        assert self.cache.expires == {}
+
+    def test_sweep_only_touches_expired_buckets(self):
+        self.cache.put(1, 1, ttl=1)
+        self.cache.put(2, 2, ttl=2)
+        self.cache.put(3, 3, ttl=10)
+        self.clock.now = 2.5
+        assert self.cache.sweep() == 2
+        assert list(self.cache.cache) == [3]
+        assert self.cache.bucket_ticks == [10]
+
+    def test_sweep_keeps_live_keys_in_current_tick(self):
+        cache = TTLLRUCache(3, resolution=10.0, clock=self.clock)
+        cache.put(1, 1, ttl=2)
+        cache.put(2, 2, ttl=8)
+        self.clock.now = 5
+        assert cache.sweep() == 1
+        assert cache.get(2) == 2
+        self.clock.now = 8
+        assert cache.sweep() == 1
+        assert cache.cache == {}
+
+    def test_reput_replaces_deadline(self):
+        self.cache.put(1, 100, ttl=1)
+        self.cache.put(1, 200, ttl=10)
+        self.clock.now = 5
+        assert self.cache.sweep() == 0
+        assert self.cache.get(1) == 200
+        self.cache.put(1, 300)
+        self.clock.now = 50
+        assert self.cache.get(1) == 300
+
+    def test_full_cache_reclaims_expired_before_evicting(self):
+        self.cache.put(1, 1, ttl=1)
+        self.cache.put(2, 2)
+        self.cache.put(3, 3)
+        self.clock.now = 2
+        self.cache.put(4, 4)
+        assert self.cache.get(2) == 2
+        assert self.cache.get(3) == 3
+        assert self.cache.get(1) == -1
+
+    def test_capacity_eviction_unschedules_key(self):
+        for key in range(5):
+            self.cache.put(key, key, ttl=100)
+        assert set(self.cache.expires) == {2, 3, 4}
+        assert self.cache.buckets[100] == {2, 3, 4}
+
+    def test_invalid_ttl(self):
+        with pytest.raises(ValueError):
+            self.cache.put(1, 1, ttl=0)
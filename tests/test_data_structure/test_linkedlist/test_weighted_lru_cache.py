@@ -0,0 +1,198 @@
+import random
+import time
+
+import pytest
+
+from test_lru_cache import ListNode, LRUCache
+
+
+class WeightedLRUCache(LRUCache):
+    """
+    LRU Cache bounded by total weight instead of entry count
+
+    weigher(value) gives each entry a weight (e.g. its size in bytes).
+    put() evicts from the tail until current_weight <= max_weight.
+
+    EXAMPLE (max_weight = 10, weigher = len):
+    =========================================
+
+    put('a', 'xxxx')      HEAD ◄──► a(4) ◄──► TAIL                 weight 4
+    put('b', 'xxxxx')     HEAD ◄──► b(5) ◄──► a(4) ◄──► TAIL       weight 9
+    put('c', 'xxx')       HEAD ◄──► c(3) ◄──► b(5) ◄──► TAIL       weight 8
+                          (a evicted: 12 > 10)
+
+    A value heavier than max_weight on its own is never cached.
+    """
+
+    def __init__(self, max_weight: int, weigher=lambda value: 1):
+        super().__init__(max_weight)
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.weights = {}
+        self.current_weight = 0
+
+    def _remove_tail(self):
+        lru_node = super()._remove_tail()
+        self.current_weight -= self.weights.pop(lru_node.key)
+        return lru_node
+
+    def _discard(self, key: int) -> None:
+        node = self.cache.pop(key)
+        self._remove_node(node)
+        self.current_weight -= self.weights.pop(key)
+
+    def _store(self, key: int, value) -> None:
+        weight = self.weigher(value)
+        if weight < 0:
+            raise ValueError("Weight must not be negative")
+        if weight > self.max_weight:
+            if key in self.cache:
+                self._discard(key)
+            return
+
+        if key in self.cache:
+            node = self.cache[key]
+            node.val = value
+            self._move_to_head(node)
+            self.current_weight += weight - self.weights[key]
+        else:
+            node = ListNode(key, value)
+            self.cache[key] = node
+            self._add_to_head(node)
+            self.current_weight += weight
+        self.weights[key] = weight
+
+        while self.current_weight > self.max_weight:
+            lru_node = self._remove_tail()
+            del self.cache[lru_node.key]
+
+
+def mixed_size_workload(num_ops, num_keys, seed=0):
+    """(key, size) requests: mostly small values with a heavy tail"""
+    rng = random.Random(seed)
+    sizes = {}
+    for key in range(num_keys):
+        roll = rng.random()
+        if roll < 0.80:
+            sizes[key] = rng.randint(16, 256)
+        elif roll < 0.98:
+            sizes[key] = rng.randint(1_024, 16_384)
+        else:
+            sizes[key] = rng.randint(262_144, 1_048_576)
+    keys = [min(int(rng.paretovariate(0.5)) - 1, num_keys - 1)
+            for _ in range(num_ops)]
+    return [(key, sizes[key]) for key in keys]
+
+
+def held_bytes(cache):
+    return sum(len(node.val) for node in cache.cache.values())
+
+
+def replay(cache_factory, workload, sample_every=100):
+    """Hit ratio, peak bytes held (sampled) and ops/s for a get-or-put replay"""
+    cache = cache_factory()
+    hits = 0
+    peak_bytes = 0
+    for i, (key, size) in enumerate(workload):
+        if cache.get(key) != -1:
+            hits += 1
+        else:
+            cache.put(key, b"x" * size)
+        if i % sample_every == 0:
+            peak_bytes = max(peak_bytes, held_bytes(cache))
+
+    # Timed on a fresh cache so sampling does not skew throughput
+    cache = cache_factory()
+    start = time.perf_counter()
+    for key, size in workload:
+        if cache.get(key) == -1:
+            cache.put(key, b"x" * size)
+    elapsed = time.perf_counter() - start
+    return {
+        "hit_ratio": hits / len(workload),
+        "peak_bytes": peak_bytes,
+        "ops_per_sec": len(workload) / elapsed,
+    }
+
+
+def compare_count_vs_weight(budget_bytes=2_000_000, num_ops=50_000,
+                            num_keys=5_000):
+    """Count-limited LRUCache sized for the average value vs byte budget"""
+    workload = mixed_size_workload(num_ops, num_keys)
+    average_size = sum(size for _, size in workload) / len(workload)
+    count_capacity = max(1, int(budget_bytes / average_size))
+    return {
+        "count": replay(lambda: LRUCache(count_capacity), workload),
+        "weighted": replay(lambda: WeightedLRUCache(budget_bytes, weigher=len),
+                           workload, sample_every=1),
+    }
+
+
+class TestWeightedLRUCache:
+
+    def test_default_weigher_behaves_like_count_capacity(self):
+        cache = WeightedLRUCache(2)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.put(3, 3)
+        assert cache.get(1) == -1
+        assert cache.current_weight == 2
+
+    def test_evicts_until_under_budget(self):
+        cache = WeightedLRUCache(10, weigher=len)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxxx')
+        cache.put('c', 'xxx')
+        assert cache.get('a') == -1
+        assert cache.current_weight == 8
+
+        cache.put('d', 'xxxxxxxxx')
+        assert list(cache.cache) == ['d']
+        assert cache.current_weight == 9
+
+    def test_update_adjusts_weight(self):
+        cache = WeightedLRUCache(10, weigher=len)
+        cache.put('a', 'xx')
+        cache.put('b', 'xx')
+        cache.put('a', 'xxxxxxx')
+        assert cache.current_weight == 9
+        cache.put('a', 'x')
+        assert cache.current_weight == 3
+
+    def test_put_many_tracks_weights(self):
+        bulk = WeightedLRUCache(10, weigher=len)
+        single = WeightedLRUCache(10, weigher=len)
+        items = [('a', 'xxxx'), ('b', 'xxxxx'), ('a', 'xx'), ('c', 'xxx'), ('d', 'xx')]
+        bulk.put_many(items)
+        for key, value in items:
+            single.put(key, value)
+
+        assert list(bulk.cache) == list(single.cache)
+        assert bulk.weights == single.weights
+        assert bulk.current_weight == single.current_weight == 7
+        assert bulk.current_weight == sum(bulk.weights.values())
+        bulk.put('e', 'xxxxxxxx')
+        assert bulk.get_many(['b', 'e']) == [-1, 'xxxxxxxx']
+
+    def test_oversized_value_is_not_cached(self):
+        cache = WeightedLRUCache(10, weigher=len)
+        cache.put('a', 'xx')
+        cache.put('big', 'x' * 11)
+        assert cache.get('big') == -1
+        assert cache.get('a') == 'xx'
+
+        cache.put('a', 'x' * 11)
+        assert cache.get('a') == -1
+        assert cache.current_weight == 0
+
+    def test_weighted_cache_respects_byte_budget(self):
+        report = compare_count_vs_weight(budget_bytes=200_000, num_ops=3_000,
+                                         num_keys=500)
+        assert report["weighted"]["peak_bytes"] <= 200_000
+
+
+if __name__ == "__main__":
+    for name, stats in compare_count_vs_weight().items():
+        print(f"{name:>8}: hit ratio {stats['hit_ratio']:.3f}, "
+              f"peak {stats['peak_bytes']:>12,} bytes, "
+              f"{stats['ops_per_sec']:>10,.0f} ops/s")
@@ -0,0 +1,229 @@
+import time
+
+import pytest
+
+from test_lru_cache import LRUCache
+
+
+class InMemoryStore:
+    """
+    Local stand-in for a slow backing store
+
+    Every write_batch() call pays a fixed round-trip delay, however many
+    items it carries, which is what makes batching worthwhile.
+    """
+
+    def __init__(self, round_trip: float = 0.0):
+        self.round_trip = round_trip
+        self.data = {}
+        self.calls = 0
+
+    def write_batch(self, items) -> None:
+        if self.round_trip:
+            time.sleep(self.round_trip)
+        self.calls += 1
+        self.data.update(items)
+
+
+class WriteThroughLRUCache(LRUCache):
+    """Baseline: every put() is written to the store immediately"""
+
+    def __init__(self, capacity: int, write_batch):
+        super().__init__(capacity)
+        self.write_batch = write_batch
+
+    def _store(self, key: int, value: int) -> None:
+        super()._store(key, value)
+        self.write_batch([(key, value)])
+
+
+class WriteBackLRUCache(LRUCache):
+    """
+    LRU Cache that delays writes to the backing store
+
+    put(k, v), put_many() ──► cache + dirty set (no store I/O)
+
+    evict dirty k ──► pending ──(batch_size reached)──► write_batch([...])
+    flush()       ──► pending + every dirty entry ──► write_batch in batches
+
+    - Clean entries are dropped on eviction without any write
+    - get()/get_many() also look in pending, so an evicted but not yet written
+      value is never lost to a reader
+    """
+
+    def __init__(self, capacity: int, write_batch, batch_size: int = 64):
+        super().__init__(capacity)
+        if batch_size <= 0:
+            raise ValueError("Batch size must larger than 0")
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.dirty = set()
+        self.pending = {}
+
+    def _write_pending(self) -> None:
+        """Write pending in batches; an entry leaves pending once written"""
+        items = list(self.pending.items())
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            self.write_batch(batch)
+            for key, _ in batch:
+                del self.pending[key]
+                self.dirty.discard(key)
+
+    def _remove_tail(self):
+        lru_node = super()._remove_tail()
+        if lru_node.key in self.dirty:
+            self.dirty.discard(lru_node.key)
+            self.pending[lru_node.key] = lru_node.val
+        return lru_node
+
+    def _miss(self, key: int) -> int:
+        return self.pending.get(key, -1)
+
+    def _store(self, key: int, value: int) -> None:
+        self.pending.pop(key, None)
+        super()._store(key, value)
+        self.dirty.add(key)
+        # Written after the cache is consistent again, so a failing store
+        # leaves the evicted values in pending for the next attempt
+        if len(self.pending) >= self.batch_size:
+            self._write_pending()
+
+    def flush(self) -> None:
+        """
+        Write every dirty entry to the store; entries stay cached
+
+        If write_batch raises, entries of the batches already written are
+        clean and the rest stay dirty or pending for the next flush().
+        """
+        for key in self.dirty:
+            self.pending[key] = self.cache[key].val
+        self._write_pending()
+
+
+def compare_write_modes(capacity=1_000, ops=5_000, round_trip=0.0002):
+    """put() throughput of write-through vs write-back (incl. final flush)"""
+    report = {}
+    for name in ("write_through", "write_back"):
+        store = InMemoryStore(round_trip)
+        if name == "write_through":
+            cache = WriteThroughLRUCache(capacity, store.write_batch)
+        else:
+            cache = WriteBackLRUCache(capacity, store.write_batch)
+        start = time.perf_counter()
+        for i in range(ops):
+            cache.put((i * 7919) % (capacity * 2), i)
+        if name == "write_back":
+            cache.flush()
+        elapsed = time.perf_counter() - start
+        report[name] = {"ops_per_sec": ops / elapsed, "store_calls": store.calls}
+    return report
+
+
+class TestWriteBackLRUCache:
+
+    def setup_method(self):
+        self.store = InMemoryStore()
+        self.cache = WriteBackLRUCache(2, self.store.write_batch, batch_size=2)
+
+    def test_put_does_not_write(self):
+        self.cache.put(1, 10)
+        self.cache.put(1, 11)
+        assert self.store.calls == 0
+        assert self.cache.dirty == {1}
+
+    def test_dirty_evictions_are_written_in_batches(self):
+        for key in range(4):
+            self.cache.put(key, key * 10)
+        assert self.store.calls == 1
+        assert self.store.data == {0: 0, 1: 10}
+        self.cache.put(4, 40)
+        assert self.cache.pending == {2: 20}
+
+    def test_get_sees_pending_value(self):
+        for key in range(3):
+            self.cache.put(key, key * 10)
+        assert self.cache.get(0) == 0
+        self.cache.put(0, 99)
+        assert self.cache.pending == {1: 10}
+        assert self.cache.get(0) == 99
+
+    def test_get_many_sees_pending_values(self):
+        self.cache.put_many([(0, 0), (1, 10), (2, 20)])
+        assert self.cache.pending == {0: 0}
+        assert self.cache.get_many([0, 2, 5]) == [0, 20, -1]
+
+    def test_flush_writes_everything_and_keeps_entries(self):
+        for key in range(3):
+            self.cache.put(key, key * 10)
+        self.cache.flush()
+        assert self.store.data == {0: 0, 1: 10, 2: 20}
+        assert self.cache.dirty == set()
+        assert self.cache.get(2) == 20
+
+        calls = self.store.calls
+        self.cache.flush()
+        assert self.store.calls == calls
+
+    def test_failed_writes_keep_unwritten_entries(self):
+        outage = {"after_calls": 1}
+
+        def flaky_write(items):
+            if self.store.calls == outage["after_calls"]:
+                raise ConnectionError("store unavailable")
+            self.store.write_batch(items)
+
+        cache = WriteBackLRUCache(4, flaky_write, batch_size=2)
+        cache.put_many([(key, key * 10) for key in range(4)])
+        with pytest.raises(ConnectionError):
+            cache.flush()
+        assert len(self.store.data) == 2
+        assert set(cache.pending) == cache.dirty == {0, 1, 2, 3} - set(self.store.data)
+
+        outage["after_calls"] = None
+        cache.flush()
+        assert self.store.data == {0: 0, 1: 10, 2: 20, 3: 30}
+        assert cache.dirty == set() and cache.pending == {}
+
+    def test_failed_eviction_write_keeps_cache_consistent(self):
+        def failing_write(items):
+            raise ConnectionError("store unavailable")
+
+        cache = WriteBackLRUCache(1, failing_write, batch_size=1)
+        cache.put(1, 10)
+        with pytest.raises(ConnectionError):
+            cache.put(2, 20)
+        assert list(cache.cache) == [2] and len(cache) == 1
+        assert cache.pending == {1: 10}
+        assert cache.get_many([1, 2]) == [10, 20]
+
+    def test_clean_entries_evict_without_writes(self):
+        self.cache.put(1, 10)
+        self.cache.flush()
+        calls = self.store.calls
+        self.cache.put(2, 20)
+        self.cache.put(3, 30)
+        assert self.store.calls == calls
+        assert self.cache.pending == {}
+
+    def test_put_many_marks_entries_dirty(self):
+        self.cache.put_many([(1, 10), (2, 20), (1, 11)])
+        assert self.cache.dirty == {1, 2}
+        self.cache.flush()
+        assert self.store.data == {1: 11, 2: 20}
+
+        through_store = InMemoryStore()
+        through = WriteThroughLRUCache(2, through_store.write_batch)
+        through.put_many({1: 10, 2: 20, 3: 30})
+        assert through_store.data == {1: 10, 2: 20, 3: 30}
+
+    def test_write_back_needs_fewer_store_calls(self):
+        report = compare_write_modes(capacity=50, ops=500, round_trip=0)
+        assert report["write_back"]["store_calls"] < \
+            report["write_through"]["store_calls"] / 10
+
+
+if __name__ == "__main__":
+    for name, stats in compare_write_modes().items():
+        print(f"{name:>13}: {stats['ops_per_sec']:>10,.0f} puts/s, "
+              f"{stats['store_calls']:>5} store calls")
@@ -1,4 +1,5 @@
 import pytest
+from array import array
 
 
 class TrieNode:
@@ -66,6 +67,141 @@ class Trie:
             node = node.children[char]
         return True
 
+    @classmethod
+    def from_sorted(cls, words):
+        """
+        Bulk-builds a frozen, minimized DAWG from words in sorted order.
+        
+        Args:
+            words (iterable of str): Words in ascending order (duplicates allowed)
+            
+        Returns:
+            DAWG: Immutable automaton with the same search/startsWith answers
+        """
+        return DAWG(words)
+
+
+class _BuildState:
+    __slots__ = ("id", "edges", "final")
+
+    def __init__(self, state_id):
+        self.id = state_id
+        self.edges = {}
+        self.final = False
+
+    def signature(self):
+        return self.final, tuple((char, child.id) for char, child in self.edges.items())
+
+
+class DAWG:
+    """
+    Minimized acyclic automaton (DAWG) built from sorted words in one pass.
+    
+    Unlike a trie it shares common suffixes as well as prefixes:
+    
+    tap, taps, top, tops:   t ─┬─ a ─┐
+                               └─ o ─┴─ p* ─ s*     (5 states; the trie needs 8)
+    
+    Build (Daciuk et al., sorted input): after each word, the states of the
+    previous word that the new word no longer shares are final, so they
+    are replaced by an equal registered state (same finality, same edges)
+    or registered themselves. Each state is checked once: linear time.
+    
+    The result is frozen into flat arrays, edges of state s sorted by char:
+    
+        offsets: array('I')   edges of s = offsets[s] .. offsets[s+1]-1
+        chars:   str          edge labels, found with str.find(c, lo, hi)
+        targets: array('I')   target state of each edge
+        final:   bytearray    1 where a word ends
+    """
+    
+    def __init__(self, words):
+        root = _BuildState(0)
+        register = {}
+        unchecked = []  # (parent, char, child) along the previous word
+        previous = None
+        next_id = 1
+        
+        for word in words:
+            if previous is not None and word <= previous:
+                if word == previous:
+                    continue
+                raise ValueError("Words must be in sorted order")
+            common = 0
+            if previous is not None:
+                limit = min(len(word), len(previous))
+                while common < limit and word[common] == previous[common]:
+                    common += 1
+            self._minimize(unchecked, register, common)
+            
+            node = unchecked[-1][2] if unchecked else root
+            for char in word[common:]:
+                child = _BuildState(next_id)
+                next_id += 1
+                node.edges[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.final = True
+            previous = word
+        self._minimize(unchecked, register, 0)
+        self._freeze(root)
+    
+    @staticmethod
+    def _minimize(unchecked, register, down_to):
+        while len(unchecked) > down_to:
+            parent, char, child = unchecked.pop()
+            key = child.signature()
+            existing = register.get(key)
+            if existing is None:
+                register[key] = child
+            else:
+                parent.edges[char] = existing
+    
+    def _freeze(self, root):
+        order = {root.id: 0}
+        states = [root]
+        for state in states:  # BFS; states grows while iterating
+            for child in state.edges.values():
+                if child.id not in order:
+                    order[child.id] = len(states)
+                    states.append(child)
+        
+        offsets, chars, targets = [0], [], []
+        self.final = bytearray(len(states))
+        for number, state in enumerate(states):
+            self.final[number] = state.final
+            for char, child in sorted(state.edges.items()):
+                chars.append(char)
+                targets.append(order[child.id])
+            offsets.append(len(targets))
+        self.offsets = array('I', offsets)
+        self.targets = array('I', targets)
+        self.chars = "".join(chars)
+    
+    def state_count(self):
+        return len(self.final)
+    
+    def insert(self, word):
+        raise TypeError("DAWG is frozen; rebuild it with Trie.from_sorted")
+    
+    def _follow(self, text):
+        """State reached by reading text from the root, or -1"""
+        offsets, chars, targets = self.offsets, self.chars, self.targets
+        state = 0
+        for char in text:
+            position = chars.find(char, offsets[state], offsets[state + 1])
+            if position < 0:
+                return -1
+            state = targets[position]
+        return state
+    
+    def search(self, word):
+        state = self._follow(word)
+        return state >= 0 and self.final[state] == 1
+    
+    def startsWith(self, prefix):
+        return self._follow(prefix) >= 0
+
 
 class TestTrie:
     
@@ -125,4 +261,52 @@ class TestTrie:
         assert trie.search("Apple") == True
         assert trie.search("apple") == False
         assert trie.startsWith("App") == True
-        assert trie.startsWith("app") == False
\ No newline at end of file
+        assert trie.startsWith("app") == False
+
+
+class TestDAWG:
+    
+    def test_shares_suffixes(self):
+        """Test that common suffixes collapse into shared states"""
+        dawg = Trie.from_sorted(["tap", "taps", "top", "tops"])
+        assert dawg.state_count() == 5  # root, t, {a, o}, p, s
+        for word in ["tap", "taps", "top", "tops"]:
+            assert dawg.search(word) == True
+        assert dawg.search("to") == False
+        assert dawg.search("tip") == False
+        assert dawg.startsWith("to") == True
+        assert dawg.startsWith("tp") == False
+    
+    def test_same_answers_as_trie(self):
+        """Test against the incremental trie on overlapping words"""
+        words = sorted(["cat", "cats", "caterpillar", "car", "card", "Apple", "a", ""])
+        trie = Trie()
+        for word in words:
+            trie.insert(word)
+        dawg = Trie.from_sorted(words)
+        for probe in words + ["ca", "cater", "apple", "App", "carts", "b"]:
+            assert dawg.search(probe) == trie.search(probe)
+            assert dawg.startsWith(probe) == trie.startsWith(probe)
+    
+    def test_minimal_on_full_product(self):
+        """All 3-letter words over 'ab' need only 4 states"""
+        words = [a + b + c for a in "ab" for b in "ab" for c in "ab"]
+        dawg = Trie.from_sorted(words)
+        assert dawg.state_count() == 4
+        assert dawg.search("aba") == True
+        assert dawg.search("ab") == False
+    
+    def test_empty_and_duplicates(self):
+        """Test empty input and repeated words"""
+        empty = Trie.from_sorted([])
+        assert empty.search("") == False
+        assert empty.startsWith("") == True
+        assert empty.startsWith("a") == False
+        assert Trie.from_sorted(["a", "a", "b"]).state_count() == 2
+    
+    def test_rejects_unsorted_and_insert(self):
+        """Test that input must be sorted and the result is frozen"""
+        with pytest.raises(ValueError):
+            Trie.from_sorted(["b", "a"])
+        with pytest.raises(TypeError):
+            Trie.from_sorted(["a"]).insert("b")
@@ -0,0 +1,225 @@
+import random
+import time
+import tracemalloc
+
+import pytest
+
+from test_prefix_tree import Trie
+
+
+class RadixNode:
+    __slots__ = ("label", "children", "is_end_of_word")
+
+    def __init__(self, label=""):
+        self.label = label
+        self.children = None  # {first char of child label: RadixNode}, None for leaves
+        self.is_end_of_word = False
+
+
+class RadixTrie(Trie):
+    """
+    Radix (Patricia) tree: single-child chains collapse into one edge label
+
+    Trie for "car", "card", "care", "cat":     RadixTrie:
+
+    c ─ a ─┬─ r* ─┬─ d*                          "ca" ─┬─ "r"* ─┬─ "d"*
+           │      └─ e*                                │        └─ "e"*
+           └─ t*                                       └─ "t"*
+
+    - One node per branch point or word end instead of one per character
+    - Edges are found by their first character, then the whole label is
+      compared at once with str.startswith
+    - insert splits an edge where a new word leaves it; search and
+      startsWith behave exactly like Trie
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+
+    def insert(self, word):
+        node, i = self.root, 0
+        while i < len(word):
+            child = node.children.get(word[i]) if node.children else None
+            if child is None:
+                leaf = RadixNode(word[i:])
+                leaf.is_end_of_word = True
+                if node.children is None:
+                    node.children = {}
+                node.children[word[i]] = leaf
+                return
+            label = child.label
+            if word.startswith(label, i):
+                node, i = child, i + len(label)
+                continue
+
+            common = 1  # the first character matched through the dict key
+            while common < len(label) and i + common < len(word) \
+                    and label[common] == word[i + common]:
+                common += 1
+            middle = RadixNode(label[:common])
+            child.label = label[common:]
+            middle.children = {child.label[0]: child}
+            node.children[word[i]] = middle
+            node, i = middle, i + common
+        node.is_end_of_word = True
+
+    def search(self, word):
+        node, i = self.root, 0
+        while i < len(word):
+            child = node.children.get(word[i]) if node.children else None
+            if child is None or not word.startswith(child.label, i):
+                return False
+            node, i = child, i + len(child.label)
+        return node.is_end_of_word
+
+    def startsWith(self, prefix):
+        node, i = self.root, 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i]) if node.children else None
+            if child is None:
+                return False
+            if not prefix.startswith(child.label, i):
+                # the prefix may end inside this edge's label
+                return child.label.startswith(prefix[i:])
+            node, i = child, i + len(child.label)
+        return True
+
+    def node_count(self):
+        count, stack = 0, [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.children:
+                stack.extend(node.children.values())
+        return count
+
+
+def random_words(count, seed=0, alphabet="abcdefghijklmnopqrstuvwxyz"):
+    """
+    Seeded dictionary-like words: shared stems plus varied endings
+
+    Real vocabularies share prefixes (un-, re-, inter-) but end in long
+    unique tails, which is exactly where single-child chains come from.
+    """
+    rng = random.Random(seed)
+    stems = ["".join(rng.choice(alphabet) for _ in range(rng.randint(2, 6)))
+             for _ in range(max(1, count // 50))]
+    words = set()
+    while len(words) < count:
+        tail = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 9)))
+        words.add(rng.choice(stems) + tail)
+    return sorted(words)
+
+
+def _build(trie_class, words):
+    trie = trie_class()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+
+def compare_tries(num_words=200_000, lookups=200_000, seed=0):
+    """Retained memory and per-lookup latency: Trie, RadixTrie, frozen DAWG"""
+    words = random_words(num_words, seed)
+    rng = random.Random(seed + 1)
+    hits = rng.choices(words, k=lookups // 2)
+    misses = [word + "#" for word in rng.choices(words, k=lookups // 2)]
+    prefixes = [word[:max(1, len(word) // 2)] for word in hits]
+    queries = hits + misses
+    rng.shuffle(queries)
+
+    report = {}
+    builders = [("trie", lambda: _build(Trie, words)),
+                ("radix", lambda: _build(RadixTrie, words)),
+                ("dawg", lambda: Trie.from_sorted(words))]
+    for name, build in builders:
+        tracemalloc.start()
+        trie = build()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for word in queries:
+            trie.search(word)
+        search_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for prefix in prefixes:
+            trie.startsWith(prefix)
+        prefix_seconds = time.perf_counter() - start
+        report[name] = {
+            "bytes": memory,
+            "search_ns": search_seconds / len(queries) * 1e9,
+            "startswith_ns": prefix_seconds / len(prefixes) * 1e9,
+        }
+    return report
+
+
+class TestRadixTrie:
+
+    def test_basic_operations(self):
+        trie = RadixTrie()
+        trie.insert("apple")
+        assert trie.search("apple") == True
+        assert trie.search("app") == False
+        assert trie.startsWith("app") == True
+
+        trie.insert("app")
+        assert trie.search("app") == True
+        assert trie.search("appl") == False
+
+    def test_edge_splits(self):
+        trie = RadixTrie()
+        for word in ["car", "card", "care", "cat"]:
+            trie.insert(word)
+        assert list(trie.root.children) == ["c"]
+        middle = trie.root.children["c"]
+        assert middle.label == "ca" and not middle.is_end_of_word
+        assert sorted(middle.children) == ["r", "t"]
+        assert sorted(middle.children["r"].children) == ["d", "e"]
+        assert trie.node_count() == 6
+        assert trie.search("ca") == False
+        assert trie.startsWith("car") == True
+        assert trie.startsWith("carx") == False
+
+    def test_empty_and_single_character(self):
+        trie = RadixTrie()
+        assert trie.search("anything") == False
+        assert trie.startsWith("any") == False
+        trie.insert("a")
+        assert trie.search("a") == True
+        assert trie.search("ab") == False
+        assert trie.startsWith("a") == True
+
+    def test_empty_word(self):
+        trie, reference = RadixTrie(), Trie()
+        assert trie.search("") == reference.search("") == False
+        trie.insert("")
+        reference.insert("")
+        assert trie.search("") == reference.search("") == True
+        assert trie.startsWith("") == reference.startsWith("") == True
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_same_answers_as_trie(self, seed):
+        words = random_words(2_000, seed)
+        rng = random.Random(seed)
+        rng.shuffle(words)
+        inserted = words[:1_000]
+        trie, reference = _build(RadixTrie, inserted), _build(Trie, inserted)
+        for word in words:
+            for probe in (word, word[:len(word) // 2], word[:-1], word + "z"):
+                assert trie.search(probe) == reference.search(probe)
+                assert trie.startsWith(probe) == reference.startsWith(probe)
+
+    def test_uses_less_memory(self):
+        report = compare_tries(num_words=5_000, lookups=1_000)
+        assert report["radix"]["bytes"] < report["trie"]["bytes"] / 3
+        assert report["dawg"]["bytes"] < report["trie"]["bytes"] / 10
+
+
+if __name__ == "__main__":
+    report = compare_tries()
+    for name, row in report.items():
+        print(f"{name:>6}: {row['bytes'] / 2**20:8.1f} MiB, "
+              f"search {row['search_ns']:7.0f} ns, "
+              f"startsWith {row['startswith_ns']:7.0f} ns")